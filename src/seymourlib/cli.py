@@ -1,19 +1,27 @@
 """Simple CLI utility to exercise the client."""
 
+from __future__ import annotations
+
 import asyncio
+import enum
 import logging
+import os
+import shlex
+import sys
 import time
-from typing import Annotated
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+from contextvars import ContextVar
+from types import TracebackType
+from typing import TYPE_CHECKING, Annotated, Any
 
 import attrs
+import click
 import typer
 from async_typer import AsyncTyper
-from rich import print as rprint
-from rich.table import Table
 
 from seymourlib.protocol import DiagnosticOption, MotorID, MovementCode, Ratio, StatusCode
 
-from .client import SeymourClient
 from .discovery import (
     DEFAULT_DISCOVERY_INTERVAL,
     DiscoveryError,
@@ -21,12 +29,28 @@ from .discovery import (
     TCPTransportCandidate,
     enumerate_serial_transports,
     enumerate_tcp_transports,
+    load_cached_tcp_transports,
+    store_cached_tcp_transports,
 )
-from .transport import SEYMOUR_BAUD_RATE, SeymourTransport
+from .exceptions import SeymourError
+from .transport import SEYMOUR_BAUD_RATE
+
+# The client (and with it tenacity) and our own uses of rich, including the log handler, are
+# imported on first use so that `--help` and argument errors don't pay for them.  Typer itself
+# still renders help and usage errors with rich when it is installed.  The transport and
+# discovery modules load eagerly: they are cheap, and their constants are option defaults.
+if TYPE_CHECKING:
+    from .client import SeymourClient
+    from .transport import SeymourTransport
+
+_LOGGER = logging.getLogger(__name__)
 
 app = AsyncTyper(help="Seymour controller CLI")
 
-STATUS_POLL_INTERVAL = 0.5
+STATUS_POLL_MIN_INTERVAL = 0.05
+STATUS_POLL_MAX_INTERVAL = 0.5
+STATUS_POLL_BACKOFF = 1.5
+STATUS_SETTLE_TIME = 2.0  # controller may take this long to report that motors are moving
 STATUS_WAIT_TIMEOUT = 60.0
 _MOVEMENT_COMPLETE_CODES: tuple[StatusCode, ...] = (
     StatusCode.HALTED,
@@ -42,7 +66,7 @@ class GlobalOptions:
     serial_port: str | None
 
 
-_GLOBAL_OPTIONS: GlobalOptions | None = None
+_GLOBAL_OPTIONS: ContextVar[GlobalOptions] = ContextVar("global_options")
 
 
 @app.callback()  # type: ignore
@@ -83,66 +107,138 @@ def handle_global_options(
         ),
     ] = None,
 ) -> None:
-    global _GLOBAL_OPTIONS
-    _GLOBAL_OPTIONS = GlobalOptions(verbose=verbose, host=host, port=port, serial_port=serial_port)
-    if verbose:
-        logging.basicConfig(level=logging.DEBUG)
-    else:
-        logging.basicConfig(level=logging.WARN)
+    _GLOBAL_OPTIONS.set(
+        GlobalOptions(verbose=verbose, host=host, port=port, serial_port=serial_port)
+    )
+    _configure_logging(verbose)
+
+
+class _DeferredRichHandler(logging.Handler):
+    """Build the RichHandler on the first record that passes the level check.
+
+    The group callback runs before subcommand arguments are parsed, so importing rich here
+    eagerly would tax ``--help`` and argument errors too.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._handler: logging.Handler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._handler is None:
+            from rich.console import Console
+            from rich.logging import RichHandler
+
+            # Like basicConfig, log to stderr so records never mix into (possibly piped) output.
+            self._handler = RichHandler(console=Console(stderr=True), rich_tracebacks=True)
+        self._handler.handle(record)
+
+
+_LOG_HANDLER: logging.Handler | None = None
+
+
+def _configure_logging(verbose: bool) -> None:
+    """Set the root log level, installing our handler the first time through.
+
+    Unlike ``logging.basicConfig``, the level is applied even if something else already
+    attached a handler to the root logger.
+    """
+    global _LOG_HANDLER
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if verbose else logging.WARNING)
+    if _LOG_HANDLER is None:
+        _LOG_HANDLER = _DeferredRichHandler()
+        root.addHandler(_LOG_HANDLER)
+
+
+def rprint(*objects: Any) -> None:
+    from rich import print as rich_print
+
+    rich_print(*objects)
 
 
 def _get_client() -> SeymourClient:
-    assert _GLOBAL_OPTIONS is not None
-    if _GLOBAL_OPTIONS.serial_port:
+    from .client import SeymourClient
+
+    options = _GLOBAL_OPTIONS.get()
+    if options.serial_port:
         from .transport import SerialTransport
 
-        transport: SeymourTransport = SerialTransport(_GLOBAL_OPTIONS.serial_port)
+        transport: SeymourTransport = SerialTransport(options.serial_port)
     else:
         from .transport import TCPTransport
 
-        transport = TCPTransport(_GLOBAL_OPTIONS.host, _GLOBAL_OPTIONS.port)
+        transport = TCPTransport(options.host, options.port)
 
     return SeymourClient(transport)
 
 
+# Commands obtain their client through this indirection so tests (or an embedding application)
+# can substitute an already-open client without monkeypatching the module.
+_client_factory: ContextVar[Callable[[], AbstractAsyncContextManager[SeymourClient]]] = ContextVar(
+    "client_factory", default=_get_client
+)
+
+
+def _open_client() -> AbstractAsyncContextManager[SeymourClient]:
+    return _client_factory.get()()
+
+
 async def _wait_for_completion(
     client: SeymourClient,
     desired_codes: tuple[StatusCode, ...] = _MOVEMENT_COMPLETE_CODES,
-    poll_interval: float = STATUS_POLL_INTERVAL,
+    min_poll_interval: float = STATUS_POLL_MIN_INTERVAL,
+    max_poll_interval: float = STATUS_POLL_MAX_INTERVAL,
     status_timeout: float = STATUS_WAIT_TIMEOUT,
+    settle_time: float = STATUS_SETTLE_TIME,
 ) -> None:
-    """Poll controller status until it reports one of the desired codes."""
+    """Poll controller status until it reports one of the desired codes.
+
+    The controller never pushes status changes, and it can take awhile before it reports that the
+    motors are moving.  Rather than sleeping through that window up front, poll immediately and
+    accept a desired code as soon as the controller has been seen busy, or once ``settle_time``
+    has elapsed without it ever reporting otherwise.
+
+    Polling starts fast so short moves return promptly, then backs off geometrically towards
+    ``max_poll_interval`` so long calibrations don't flood the serial line.
+    """
     desired_labels = ", ".join(code.name for code in desired_codes)
     start = time.monotonic()
-
-    # Initial delay before first poll - can take awhile for controller to report that motors are moving
-    await asyncio.sleep(poll_interval * 4)
+    seen_busy = False
+    delay = min_poll_interval
 
     while True:
         status = await client.get_status()
         last_status = status.code
-        if last_status in desired_codes:
-            assert _GLOBAL_OPTIONS is not None
-            if _GLOBAL_OPTIONS.verbose:
+        elapsed = time.monotonic() - start
+        if last_status not in desired_codes:
+            seen_busy = True
+        elif seen_busy or elapsed >= settle_time:
+            if _GLOBAL_OPTIONS.get().verbose:
                 rprint(f"[green]Controller status:[/green] {last_status.name}")
             return
 
-        if time.monotonic() - start >= status_timeout:
+        if elapsed >= status_timeout:
             typer.secho(
                 f"Timed out waiting for status {desired_labels}; last status was {last_status.name if last_status else 'unknown'}",
                 fg="red",
             )
             raise typer.Exit(code=1)
 
-        await asyncio.sleep(poll_interval)
+        await asyncio.sleep(delay)
+        delay = min(delay * STATUS_POLL_BACKOFF, max_poll_interval)
+
+
+async def _do_status(client: SeymourClient) -> None:
+    status = await client.get_status()
+    rprint(status)
 
 
 @app.async_command()  # type: ignore
 async def status() -> None:
     """Show the current status code."""
-    async with _get_client() as client:
-        status = await client.get_status()
-        rprint(status)
+    async with _open_client() as client:
+        await _do_status(client)
 
 
 discover_app = AsyncTyper(help="Discover available Seymour transports.")
@@ -156,6 +252,25 @@ def _render_tcp_candidates(candidates: list[TCPTransportCandidate]) -> None:
         typer.echo("No Global Caché IP2SL devices were discovered.")
         return
 
+    if not sys.stdout.isatty():
+        # Piped to a script: skip rich's layout work and emit one tab-separated line per host.
+        for candidate in candidates:
+            metadata = candidate.metadata
+            typer.echo(
+                "\t".join(
+                    (
+                        candidate.host,
+                        str(candidate.port),
+                        metadata.get("Model", metadata.get("Make", "")),
+                        metadata.get("Status", ""),
+                        metadata.get("UUID", ""),
+                    )
+                )
+            )
+        return
+
+    from rich.table import Table
+
     table = Table(title="Discovered TCP transports")
     table.add_column("Host", style="cyan")
     table.add_column("Port", justify="right")
@@ -183,6 +298,22 @@ def _render_serial_candidates(candidates: list[SerialTransportCandidate]) -> Non
         typer.echo("No serial ports were detected.")
         return
 
+    if not sys.stdout.isatty():
+        for candidate in candidates:
+            typer.echo(
+                "\t".join(
+                    (
+                        candidate.device,
+                        str(candidate.baudrate),
+                        candidate.description or "-",
+                        candidate.hardware_id or "-",
+                    )
+                )
+            )
+        return
+
+    from rich.table import Table
+
     table = Table(title="Available serial transports")
     table.add_column("Device", style="cyan")
     table.add_column("Baud", justify="right")
@@ -210,17 +341,39 @@ async def discover_tcp(
             help="Seconds to listen for Global Caché multicast beacons.",
         ),
     ] = DEFAULT_DISCOVERY_INTERVAL,
+    refresh: Annotated[
+        bool,
+        typer.Option(
+            "--refresh",
+            "-r",
+            help="Ignore recently cached results and listen for beacons again.",
+        ),
+    ] = False,
 ) -> None:
     """List TCP transports discovered on the local network."""
 
     if interval <= 0:
         raise typer.BadParameter("Interval value must be greater than zero.")
+
+    # Only trust the cache when the user hasn't asked for a specific listen window.
+    if not refresh and interval == DEFAULT_DISCOVERY_INTERVAL:
+        cached = await load_cached_tcp_transports()
+        if cached:
+            _render_tcp_candidates(cached)
+            return
+
     try:
         candidates = await enumerate_tcp_transports(interval=interval)
     except DiscoveryError as exc:
         typer.secho(str(exc), fg="red")
         raise typer.Exit(code=1) from exc
 
+    if candidates:
+        try:
+            await store_cached_tcp_transports(candidates)
+        except OSError as exc:
+            _LOGGER.debug("Unable to write discovery cache: %s", exc)
+
     _render_tcp_candidates(candidates)
 
 
@@ -249,161 +402,510 @@ async def discover_serial(
     _render_serial_candidates(candidates)
 
 
+@discover_app.async_command("all")  # type: ignore
+async def discover_all(
+    interval: Annotated[
+        float,
+        typer.Option(
+            "--interval",
+            "-i",
+            help="Seconds to listen for Global Caché multicast beacons.",
+        ),
+    ] = DEFAULT_DISCOVERY_INTERVAL,
+    baudrate: Annotated[
+        int,
+        typer.Option(
+            "--baudrate",
+            "-b",
+            help="Baud rate to use when instantiating Serial transports.",
+        ),
+    ] = SEYMOUR_BAUD_RATE,
+) -> None:
+    """List TCP and Serial transports, scanning for both concurrently."""
+
+    if interval <= 0:
+        raise typer.BadParameter("Interval value must be greater than zero.")
+    if baudrate <= 0:
+        raise typer.BadParameter("Baud rate must be greater than zero.")
+
+    tcp_result, serial_result = await asyncio.gather(
+        enumerate_tcp_transports(interval=interval),
+        enumerate_serial_transports(baudrate=baudrate),
+        return_exceptions=True,
+    )
+
+    failed = False
+    if isinstance(tcp_result, BaseException):
+        if not isinstance(tcp_result, DiscoveryError):
+            raise tcp_result
+        typer.secho(str(tcp_result), fg="red")
+        failed = True
+    else:
+        _render_tcp_candidates(tcp_result)
+
+    if isinstance(serial_result, BaseException):
+        if not isinstance(serial_result, DiscoveryError):
+            raise serial_result
+        typer.secho(str(serial_result), fg="red")
+        failed = True
+    else:
+        _render_serial_candidates(serial_result)
+
+    if failed:
+        raise typer.Exit(code=1)
+
+
+async def _do_calibrate(client: SeymourClient, motor: MotorID) -> None:
+    await client.calibrate(motor)
+    await _wait_for_completion(client)
+
+
 @app.async_command()  # type: ignore
 async def calibrate(motor: Annotated[MotorID, typer.Argument()] = MotorID.ALL) -> None:
     """Calibrate the given motor(s) by moving all the way in & out."""
-    async with _get_client() as client:
-        await client.calibrate(motor)
-        await _wait_for_completion(client)
+    async with _open_client() as client:
+        await _do_calibrate(client, motor)
 
 
 positions_app = AsyncTyper(help="Commands for the motors' absolute positions.")
 app.add_typer(positions_app, name="positions")
 
 
+async def _do_positions_get(client: SeymourClient) -> None:
+    positions = await client.get_positions()
+    for position in positions:
+        rprint(position)
+
+
 @positions_app.async_command("get")  # type: ignore
 async def positions_get() -> None:
     """Show the current motor positions."""
-    async with _get_client() as client:
-        positions = await client.get_positions()
-        for position in positions:
-            rprint(position)
+    async with _open_client() as client:
+        await _do_positions_get(client)
+
+
+async def _do_positions_halt(client: SeymourClient, motor: MotorID) -> None:
+    await client.halt(motor)
+    await _wait_for_completion(client)
 
 
 @positions_app.async_command("halt")  # type: ignore
 async def positions_halt(motor: Annotated[MotorID, typer.Argument()] = MotorID.ALL) -> None:
     """Stop the specified motor(s) at their current position."""
-    async with _get_client() as client:
-        await client.halt(motor)
-        await _wait_for_completion(client)
+    async with _open_client() as client:
+        await _do_positions_halt(client, motor)
+
+
+async def _do_positions_home(client: SeymourClient, motor: MotorID) -> None:
+    await client.home(motor)
+    await _wait_for_completion(client)
 
 
 @positions_app.async_command("home")  # type: ignore
 async def positions_home(motor: Annotated[MotorID, typer.Argument()] = MotorID.ALL) -> None:
     """Move the specified motor(s) to their home position."""
-    async with _get_client() as client:
-        await client.home(motor)
-        await _wait_for_completion(client)
-
-
-def _parse_increment(move: bool, jog: bool, until_limit: bool) -> MovementCode:
-    match (move, jog, until_limit):
-        case (True, False, False):
-            return MovementCode.MOVE
-        case (False, True, False):
-            return MovementCode.JOG
-        case (False, False, True):
-            return MovementCode.UNTIL_LIMIT
-        case _:
-            raise typer.BadParameter(
-                "Exactly one of --move, --jog, or --until-limit must be specified."
-            )
+    async with _open_client() as client:
+        await _do_positions_home(client, motor)
+
+
+class Increment(enum.StrEnum):
+    MOVE = "move"
+    JOG = "jog"
+    UNTIL_LIMIT = "until-limit"
+
+
+_INCREMENT_TO_CODE: dict[Increment, MovementCode] = {
+    Increment.MOVE: MovementCode.MOVE,
+    Increment.JOG: MovementCode.JOG,
+    Increment.UNTIL_LIMIT: MovementCode.UNTIL_LIMIT,
+}
+
+IncrementOption = Annotated[
+    Increment,
+    typer.Option("--increment", "-i", case_sensitive=False, help="How far to move the motor(s)."),
+]
+
+
+async def _do_positions_in(client: SeymourClient, motor: MotorID, increment: MovementCode) -> None:
+    await client.move_in(motor, increment)
+    await _wait_for_completion(client)
 
 
 @positions_app.async_command("in")  # type: ignore
 async def positions_in(
     motor: Annotated[MotorID, typer.Argument()] = MotorID.ALL,
-    move: bool = True,
-    jog: bool = False,
-    until_limit: bool = False,
+    increment: IncrementOption = Increment.MOVE,
 ) -> None:
     """Move the specified motor(s) inward by the given increment."""
-    increment = _parse_increment(move, jog, until_limit)
-    async with _get_client() as client:
-        await client.move_in(motor, increment)
-        await _wait_for_completion(client)
+    async with _open_client() as client:
+        await _do_positions_in(client, motor, _INCREMENT_TO_CODE[increment])
+
+
+async def _do_positions_out(client: SeymourClient, motor: MotorID, increment: MovementCode) -> None:
+    await client.move_out(motor, increment)
+    await _wait_for_completion(client)
 
 
 @positions_app.async_command("out")  # type: ignore
 async def positions_out(
     motor: Annotated[MotorID, typer.Argument()] = MotorID.ALL,
-    move: bool = True,
-    jog: bool = False,
-    until_limit: bool = False,
+    increment: IncrementOption = Increment.MOVE,
 ) -> None:
     """Move the specified motor(s) outward by the given increment."""
-    increment = _parse_increment(move, jog, until_limit)
-    async with _get_client() as client:
-        await client.move_out(motor, increment)
-        await _wait_for_completion(client)
+    async with _open_client() as client:
+        await _do_positions_out(client, motor, _INCREMENT_TO_CODE[increment])
 
 
 preset_app = AsyncTyper(help="Commands for motor presets.")
 app.add_typer(preset_app, name="preset")
 
 
-def _parse_ratio_id(ratio_id: str) -> Ratio:
-    try:
-        return Ratio(ratio_id)
-    except ValueError as exc:
-        raise typer.BadParameter(f"Invalid ratio ID: {ratio_id}") from exc
+class RatioParam(click.ParamType):
+    """Validate ratio IDs while parsing argv, before any connection is opened."""
+
+    name = "ratio"
+
+    def convert(
+        self, value: Any, param: click.Parameter | None, ctx: click.Context | None
+    ) -> Ratio:
+        if isinstance(value, Ratio):
+            return value
+        try:
+            return Ratio(value)
+        except ValueError:
+            self.fail(f"Invalid ratio ID: {value}", param, ctx)
+
+
+async def _do_preset_apply(client: SeymourClient, ratio: Ratio) -> None:
+    await client.move_to_ratio(ratio)
+    await _wait_for_completion(client)
 
 
 @preset_app.async_command("apply")  # type: ignore
 async def preset_apply(
-    ratio_id: Annotated[str, typer.Argument(help="3-digit ratio ID, e.g. '235' for 2.35:1")],
+    ratio: Annotated[
+        Ratio,
+        typer.Argument(click_type=RatioParam(), help="3-digit ratio ID, e.g. '235' for 2.35:1"),
+    ],
 ) -> None:
     """Move motors to the designated ratio preset."""
-    ratio = _parse_ratio_id(ratio_id)
-    async with _get_client() as client:
-        await client.move_to_ratio(ratio)
-        await _wait_for_completion(client)
+    async with _open_client() as client:
+        await _do_preset_apply(client, ratio)
+
+
+async def _do_preset_list(client: SeymourClient) -> None:
+    settings = await client.get_ratio_settings()
+    for preset in settings:
+        rprint(preset)
 
 
 @preset_app.async_command("list")  # type: ignore
 async def preset_list() -> None:
     """List all stored ratio presets."""
-    async with _get_client() as client:
-        settings = await client.get_ratio_settings()
-        for preset in settings:
-            rprint(preset)
+    async with _open_client() as client:
+        await _do_preset_list(client)
 
 
 @preset_app.async_command("reset")  # type: ignore
 async def preset_reset(
-    ratio_id: Annotated[
-        str | None,
-        typer.Argument(help="3-digit ratio ID, e.g. '235' for 2.35:1.  Default: ALL PRESETS"),
+    ratio: Annotated[
+        Ratio | None,
+        typer.Argument(
+            click_type=RatioParam(),
+            help="3-digit ratio ID, e.g. '235' for 2.35:1.  Default: ALL PRESETS",
+        ),
     ] = None,
 ) -> None:
     """Restore the given ratio preset(s) to their factory default."""
-    ratio = _parse_ratio_id(ratio_id) if ratio_id else None
     ratio_text = ratio if ratio else "ALL PRESETS"
     typer.confirm(f"Are you sure you want to reset {ratio_text} to factory default?", abort=True)
-    async with _get_client() as client:
+    async with _open_client() as client:
         await client.reset_factory_default(ratio)
 
 
+async def _do_preset_store(client: SeymourClient, ratio: Ratio) -> None:
+    await client.update_ratio(ratio)
+
+
 @preset_app.async_command("store")  # type: ignore
 async def preset_store(
-    ratio_id: Annotated[str, typer.Argument(help="3-digit ratio ID, e.g. '235' for 2.35:1")],
+    ratio: Annotated[
+        Ratio,
+        typer.Argument(click_type=RatioParam(), help="3-digit ratio ID, e.g. '235' for 2.35:1"),
+    ],
 ) -> None:
     """Store the current motor positions as the designated ratio preset."""
-    ratio = _parse_ratio_id(ratio_id)
-    async with _get_client() as client:
-        await client.update_ratio(ratio)
+    async with _open_client() as client:
+        await _do_preset_store(client, ratio)
 
 
 system_app = AsyncTyper(help="Commands for reading system internals.")
 app.add_typer(system_app, name="system")
 
 
+async def _do_system_info(client: SeymourClient) -> None:
+    info = await client.get_system_info()
+    for field in attrs.fields(type(info)):
+        rprint(f"[bold yellow]{field.name}[/bold yellow]: {getattr(info, field.name)}")
+
+
 @system_app.async_command("info")  # type: ignore
 async def system_info() -> None:
     """Show static information about the Seymour screen system."""
-    async with _get_client() as client:
-        info = await client.get_system_info()
-        for key, value in attrs.asdict(info).items():
-            rprint(f"[bold yellow]{key}[/bold yellow]: {value}")
+    async with _open_client() as client:
+        await _do_system_info(client)
+
+
+async def _do_diagnostics(client: SeymourClient, option: DiagnosticOption) -> None:
+    diag = await client.get_diagnostics(option)
+    rprint(diag)
 
 
 @system_app.async_command()  # type: ignore
 async def diagnostics(option: DiagnosticOption) -> None:
     """Show diagnostic information from the Seymour screen system."""
-    async with _get_client() as client:
-        diag = await client.get_diagnostics(option)
-        rprint(diag)
+    async with _open_client() as client:
+        await _do_diagnostics(client, option)
+
+
+async def _do_dashboard(client: SeymourClient) -> None:
+    status, positions, presets, info = await asyncio.gather(
+        client.get_status(),
+        client.get_positions(),
+        client.get_ratio_settings(),
+        client.get_system_info(),
+    )
+
+    from rich.console import Group
+    from rich.table import Table
+
+    summary = Table(title="Seymour screen", show_header=False)
+    summary.add_column(style="bold yellow")
+    summary.add_column()
+    summary.add_row("Status", f"{status.code.name} {status.ratio.id if status.ratio else ''}")
+    summary.add_row("Model", info.screen_model)
+    summary.add_row("Size", f"{info.width_inches} x {info.height_inches} in")
+    summary.add_row("Serial", info.serial_number.to_serial_number())
+
+    motors = Table(title="Motor positions")
+    motors.add_column("Motor", style="cyan")
+    motors.add_column("Position %", justify="right")
+    for position in positions:
+        motors.add_row(position.motor_id.name, f"{position.position_pct:.1f}")
+
+    ratios = Table(title="Ratio presets")
+    ratios.add_column("Ratio", style="cyan")
+    ratios.add_column("Label")
+    ratios.add_column("Width", justify="right")
+    ratios.add_column("Height", justify="right")
+    ratios.add_column("Positions %", justify="right")
+    for preset in presets:
+        ratios.add_row(
+            preset.ratio.id,
+            preset.label,
+            f"{preset.width_inches:.1f}",
+            f"{preset.height_inches:.1f}",
+            " / ".join(f"{pct:.1f}" for pct in preset.motor_positions_pct),
+        )
+
+    rprint(Group(summary, motors, ratios))
+
+
+@app.async_command()  # type: ignore
+async def dashboard() -> None:
+    """Show status, positions, presets and system info in one go."""
+    async with _open_client() as client:
+        await _do_dashboard(client)
+
+
+def _repl_motor(args: list[str], index: int = 0) -> MotorID:
+    return MotorID(args[index].upper()) if len(args) > index else MotorID.ALL
+
+
+def _repl_increment(args: list[str]) -> MovementCode:
+    if len(args) < 2:
+        return MovementCode.MOVE
+    try:
+        return _INCREMENT_TO_CODE[Increment(args[1].lower())]
+    except ValueError:
+        raise ValueError(f"increment must be one of: {', '.join(Increment)}") from None
+
+
+def _repl_ratio(args: list[str]) -> Ratio:
+    if not args:
+        raise ValueError("a 3-digit ratio ID is required")
+    return Ratio(args[0])
+
+
+def _repl_option(args: list[str]) -> DiagnosticOption:
+    if not args:
+        raise ValueError(f"option must be one of: {', '.join(o.value for o in DiagnosticOption)}")
+    return DiagnosticOption(args[0])
+
+
+_ReplHandler = Callable[["SeymourClient", list[str]], Awaitable[None]]
+
+_REPL_COMMANDS: dict[str, _ReplHandler] = {
+    "status": lambda client, args: _do_status(client),
+    "dashboard": lambda client, args: _do_dashboard(client),
+    "calibrate": lambda client, args: _do_calibrate(client, _repl_motor(args)),
+    "positions get": lambda client, args: _do_positions_get(client),
+    "positions halt": lambda client, args: _do_positions_halt(client, _repl_motor(args)),
+    "positions home": lambda client, args: _do_positions_home(client, _repl_motor(args)),
+    "positions in": lambda client, args: _do_positions_in(
+        client, _repl_motor(args), _repl_increment(args)
+    ),
+    "positions out": lambda client, args: _do_positions_out(
+        client, _repl_motor(args), _repl_increment(args)
+    ),
+    "preset apply": lambda client, args: _do_preset_apply(client, _repl_ratio(args)),
+    "preset list": lambda client, args: _do_preset_list(client),
+    "preset store": lambda client, args: _do_preset_store(client, _repl_ratio(args)),
+    "system info": lambda client, args: _do_system_info(client),
+    "system diagnostics": lambda client, args: _do_diagnostics(client, _repl_option(args)),
+}
+
+_REPL_EXIT_COMMANDS = frozenset({"exit", "quit"})
+
+
+async def _dispatch_repl_line(client: SeymourClient, line: str) -> None:
+    """Run one REPL line against an already-connected client."""
+    words = shlex.split(line)
+    for n_words in (2, 1):
+        handler = _REPL_COMMANDS.get(" ".join(words[:n_words]))
+        if handler is not None:
+            await handler(client, words[n_words:])
+            return
+    raise ValueError(f"Unknown command: {line.strip()!r} (type 'help' for a list)")
+
+
+def _stdin_fd() -> int | None:
+    """Return stdin's file descriptor if the event loop may be able to watch it."""
+    if os.name != "posix":
+        return None
+    try:
+        return sys.stdin.fileno()
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class _PromptReader:
+    """Read REPL lines without parking a thread in ``input()``.
+
+    ``asyncio.run`` joins the default executor on the way out, so a worker blocked in
+    ``input()`` keeps Ctrl-C from ending the session until the user presses Enter.  Where the
+    loop can watch stdin (terminals and pipes on POSIX) lines are read as the fd becomes
+    readable; otherwise this falls back to ``input()`` on a worker thread.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, fd: int | None) -> None:
+        self._loop = loop
+        self._fd = fd
+        self._encoding = getattr(sys.stdin, "encoding", None) or "utf-8"
+        self._buffer = bytearray()
+        self._eof = False
+        self._waiter: asyncio.Future[None] | None = None
+        if fd is not None:
+            try:
+                # Plain os.read calls on a still-blocking fd: connect_read_pipe would switch the
+                # fd to non-blocking, which the shell sharing the terminal would inherit.
+                loop.add_reader(fd, self._on_readable)
+            except (OSError, ValueError, NotImplementedError):
+                # e.g. a regular file, which epoll refuses to watch.
+                self._fd = None
+
+    def __enter__(self) -> _PromptReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._fd is not None and not self._eof:
+            self._loop.remove_reader(self._fd)
+
+    def _on_readable(self) -> None:
+        assert self._fd is not None
+        try:
+            data = os.read(self._fd, 4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if data:
+            self._buffer += data
+        else:
+            self._eof = True
+            self._loop.remove_reader(self._fd)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def readline(self, prompt: str) -> str:
+        """Show ``prompt`` and return the next line, raising EOFError like ``input()``."""
+        if self._fd is None:
+            return await asyncio.to_thread(input, prompt)
+
+        typer.echo(prompt, nl=False)
+        while True:
+            end = self._buffer.find(b"\n")
+            if end < 0 and self._eof and self._buffer:
+                end = len(self._buffer)
+            if end >= 0:
+                line = bytes(self._buffer[:end])
+                del self._buffer[: end + 1]
+                return line.decode(self._encoding, errors="replace").rstrip("\r")
+            if self._eof:
+                raise EOFError
+
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+
+@app.async_command()  # type: ignore
+async def repl() -> None:
+    """Run commands interactively over a single persistent connection."""
+    async with _open_client() as client:
+        with _PromptReader(asyncio.get_running_loop(), _stdin_fd()) as prompt:
+            while True:
+                try:
+                    line = await prompt.readline("seymour> ")
+                except EOFError:
+                    break
+
+                command = line.strip()
+                if not command:
+                    continue
+                if command in _REPL_EXIT_COMMANDS:
+                    break
+                if command == "help":
+                    for name in _REPL_COMMANDS:
+                        typer.echo(name)
+                    continue
+
+                try:
+                    await _dispatch_repl_line(client, command)
+                except (ValueError, SeymourError) as exc:
+                    typer.secho(str(exc), fg="red")
+                except typer.Exit:
+                    # e.g. _wait_for_completion timing out; keep the session alive.
+                    pass
+
+
+def _use_uvloop() -> None:
+    """Run commands on uvloop when it happens to be installed; it is not a dependency."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 def main() -> None:
+    _use_uvloop()
     app()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections.abc import Callable
 
 from tenacity import (
     AsyncRetrying,
@@ -33,6 +34,16 @@ HEALTH_CHECK_TIMEOUT = 3.0
 
 
 class SeymourClient:
+    """Async client for a Seymour masking controller.
+
+    ``request_timeout`` bounds each attempt at a send/receive pair, not the whole
+    operation: a timed-out attempt is retried (up to ``max_retries`` attempts in total,
+    with backoff between them), since a lost or corrupted frame is usually recovered
+    by draining the buffer and asking again. A request against an unresponsive device
+    can therefore take roughly ``max_retries * request_timeout`` plus backoff before
+    failing.
+    """
+
     def __init__(
         self,
         transport: SeymourTransport,
@@ -44,28 +55,48 @@ class SeymourClient:
         self._connected = False
         self.max_retries = max_retries
         self.request_timeout = request_timeout
+        # Connection bookkeeping uses a monotonic clock (the same one asyncio's loop
+        # uses) so wall-clock adjustments can neither trigger nor suppress health checks.
+        self._clock: Callable[[], float] = time.monotonic
         self._last_successful_operation = 0.0
         self._health_check_task: asyncio.Task[None] | None = None
 
-    async def _connect_with_retry(self) -> None:
-        """Connect with tenacity-managed retry logic."""
-        retryer = AsyncRetrying(
-            stop=stop_after_attempt(self.max_retries),
+        # Retry policies are built once and copied per call: tenacity keeps the
+        # in-progress attempt state on the retryer itself, so concurrent callers
+        # must not iterate the same instance, but the copies share these strategies.
+        self._connect_retryer = AsyncRetrying(
+            stop=stop_after_attempt(max_retries),
             wait=wait_exponential(multiplier=1, min=1, max=30),
             retry=retry_if_exception_type((SeymourTransportError, ConnectionError, OSError)),
             before_sleep=before_sleep_log(_LOGGER, logging.WARNING),
             after=after_log(_LOGGER, logging.INFO),
         )
+        self._op_retryer = AsyncRetrying(
+            stop=stop_after_attempt(max_retries),
+            wait=wait_exponential(multiplier=0.5, min=0.5, max=10),
+            retry=retry_if_exception_type(
+                (SeymourTransportError, TimeoutError, ConnectionError, OSError)
+            ),
+            before_sleep=before_sleep_log(_LOGGER, logging.WARNING),
+        )
 
-        async for attempt in retryer:
+    async def _connect_with_retry(self) -> None:
+        """Connect with tenacity-managed retry logic."""
+        async for attempt in self._connect_retryer.copy():
             with attempt:
                 await self.transport.connect()
                 self._connected = True
-                self._last_successful_operation = time.time()
+                self._last_successful_operation = self._clock()
 
     async def connect(self) -> None:
+        # Fast path: _connected is only set under the lock, so re-check there before connecting
+        if self._connected:
+            return
+
         async with self._lock:
-            if self._connected:
+            # Another task may have connected while we waited (read via the property,
+            # which the type checker does not narrow from the check above)
+            if self.is_connected:
                 return
 
             try:
@@ -105,8 +136,13 @@ class SeymourClient:
             try:
                 await asyncio.sleep(interval)
 
+                # Re-establish a dropped connection here rather than on the next request
+                if not self._connected:
+                    await self._background_reconnect()
+                    continue
+
                 # Skip health check if we've had recent successful operations
-                if time.time() - self._last_successful_operation < interval / 2:
+                if self._clock() - self._last_successful_operation < interval / 2:
                     continue
 
                 # Perform lightweight health check
@@ -125,6 +161,26 @@ class SeymourClient:
                 _LOGGER.error("Unexpected error in health monitoring: %s", exc)
                 await asyncio.sleep(interval)  # Continue monitoring despite errors
 
+    async def _background_reconnect(self) -> None:
+        """Make one reconnection attempt on behalf of the health monitor.
+
+        The attempt holds the client lock, so requests issued meanwhile wait for it and
+        then reuse the new connection instead of starting their own connect-with-backoff
+        sequence. Failures are left for the next health check interval to retry.
+        """
+        async with self._lock:
+            if self._connected:
+                return
+            try:
+                async with asyncio.timeout(self.request_timeout):
+                    await self.transport.connect()
+            except (SeymourTransportError, TimeoutError, ConnectionError, OSError) as exc:
+                _LOGGER.debug("Background reconnect failed, will retry: %s", exc)
+                return
+            self._connected = True
+            self._last_successful_operation = self._clock()
+            _LOGGER.info("Reconnected Seymour transport in the background")
+
     async def _health_check(self) -> None:
         """Perform a lightweight health check by requesting status."""
         hc_timeout = min(HEALTH_CHECK_TIMEOUT, self.request_timeout)
@@ -139,13 +195,14 @@ class SeymourClient:
     @property
     def connection_stats(self) -> dict[str, float]:
         """Get connection statistics for monitoring."""
+        if self._last_successful_operation <= 0:
+            return {"last_successful_operation": 0.0, "time_since_last_success": -1}
+
+        # Report the last success as a wall-clock timestamp, derived from the monotonic age.
+        elapsed = self._clock() - self._last_successful_operation
         return {
-            "last_successful_operation": self._last_successful_operation,
-            "time_since_last_success": (
-                time.time() - self._last_successful_operation
-                if self._last_successful_operation > 0
-                else -1
-            ),
+            "last_successful_operation": time.time() - elapsed,
+            "time_since_last_success": elapsed,
         }
 
     async def __aenter__(self) -> SeymourClient:
@@ -176,16 +233,8 @@ class SeymourClient:
         caller consumes bytes belonging to the other's response.
         """
         effective_timeout = op_timeout if op_timeout is not None else self.request_timeout
-        retryer = AsyncRetrying(
-            stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=0.5, min=0.5, max=10),
-            retry=retry_if_exception_type(
-                (SeymourTransportError, TimeoutError, ConnectionError, OSError)
-            ),
-            before_sleep=before_sleep_log(_LOGGER, logging.WARNING),
-        )
 
-        async for attempt in retryer:
+        async for attempt in self._op_retryer.copy():
             with attempt:
                 async with self._lock:
                     # Ensure connection before operation
@@ -212,10 +261,10 @@ class SeymourClient:
                         await self.transport.send(frame)
                         if receive:
                             response = await self.transport.receive()
-                            self._last_successful_operation = time.time()
+                            self._last_successful_operation = self._clock()
                             return response
                         else:
-                            self._last_successful_operation = time.time()
+                            self._last_successful_operation = self._clock()
                             return None
 
         # This should never be reached due to retry logic, but satisfy type checker
@@ -229,7 +278,7 @@ class SeymourClient:
     ) -> bytes | None:
         """Send frame and optionally receive response with automatic reconnection."""
         try:
-            logging.debug("Sending frame: %s", frame)
+            _LOGGER.debug("Sending frame: %r", frame)
             return await self._execute_operation(frame, receive, op_timeout=op_timeout)
         except (
             SeymourTransportError,
@@ -257,7 +306,7 @@ class SeymourClient:
     async def _send_and_receive(self, frame: bytes, op_timeout: float | None = None) -> bytes:
         """Low-level: send frame and await reply frame."""
         raw = await self._send_and_maybe_receive(frame, receive=True, op_timeout=op_timeout)
-        logging.debug("Received frame: %s", raw)
+        _LOGGER.debug("Received frame: %r", raw)
         assert raw is not None
         return raw
 
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
+import os
+import re
 import socket
 import struct
+import tempfile
+import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
 from .transport import ITACH_SERIAL_PORT, SEYMOUR_BAUD_RATE, SerialTransport, TCPTransport
@@ -14,13 +21,20 @@ MCAST_GROUP = "239.255.250.250"
 MCAST_PORT = 9131
 MAX_MESSAGE_SIZE = 2048
 DEFAULT_DISCOVERY_INTERVAL = 12.0  # in practice, beacons arrive every 10 seconds
+DEFAULT_CACHE_TTL = 30.0
+
+_MREQ_STRUCT = struct.Struct("=4s4s")
+_AMXB_FIELD_RE = re.compile(r"<-([^=>]+)(?:=([^>]*))?>")
 
 __all__ = [
     "DiscoveryError",
     "SerialTransportCandidate",
     "TCPTransportCandidate",
+    "default_cache_path",
     "enumerate_serial_transports",
     "enumerate_tcp_transports",
+    "load_cached_tcp_transports",
+    "store_cached_tcp_transports",
 ]
 
 
@@ -59,12 +73,14 @@ async def enumerate_tcp_transports(
     if interval <= 0:
         raise ValueError("interval must be positive")
 
+    loop = asyncio.get_running_loop()
     try:
-        sock = _create_multicast_socket(interface_ip)
+        # Binding and joining the group can stall on interface configuration, so keep it
+        # off the event loop thread.
+        sock = await loop.run_in_executor(None, _create_multicast_socket, interface_ip)
     except OSError as exc:
         raise DiscoveryError(f"Unable to join discovery multicast group: {exc}") from exc
 
-    loop = asyncio.get_running_loop()
     try:
         transport, protocol = await _bind_datagram_listener(sock)
     except Exception:
@@ -74,7 +90,8 @@ async def enumerate_tcp_transports(
     devices: dict[str, TCPTransportCandidate] = {}
     try:
         deadline = loop.time() + interval
-        while True:
+        finished = False
+        while not finished:
             remaining = deadline - loop.time()
             if remaining <= 0:
                 break
@@ -84,29 +101,28 @@ async def enumerate_tcp_transports(
             except TimeoutError:
                 break
 
-            if record is None:
-                if protocol.error:
-                    raise DiscoveryError(
-                        f"Failed while reading discovery beacons: {protocol.error}"
-                    ) from protocol.error
-                break
-
-            payload, (host, _port) = record
-
-            raw_text = _safe_decode(payload)
-            metadata: dict[str, str]
-            try:
-                metadata = _parse_amxb_payload(raw_text)
-            except ValueError:
-                metadata = {}
-
-            devices[host] = TCPTransportCandidate(
-                transport=TCPTransport(host, ITACH_SERIAL_PORT),
-                host=host,
-                port=ITACH_SERIAL_PORT,
-                metadata=metadata,
-                raw_beacon=raw_text,
-            )
+            # Handle everything that queued up while we were waiting in one go, rather than
+            # paying an event-loop round trip per beacon.
+            batch = [record]
+            while not protocol.queue.empty():
+                batch.append(protocol.queue.get_nowait())
+
+            for record in batch:
+                if record is None:
+                    if protocol.error:
+                        raise DiscoveryError(
+                            f"Failed while reading discovery beacons: {protocol.error}"
+                        ) from protocol.error
+                    finished = True
+                    break
+
+                payload, (host, _port) = record
+                candidate = devices.get(host)
+                if candidate is None:
+                    devices[host] = _candidate_from_beacon(host, payload)
+                elif not candidate.metadata:
+                    # Keep the existing transport; only refresh an unparseable beacon.
+                    candidate.raw_beacon, candidate.metadata = _decode_beacon(payload)
     finally:
         transport.close()
 
@@ -150,10 +166,139 @@ async def enumerate_serial_transports(
     return sorted(candidates, key=lambda candidate: candidate.device)
 
 
+def default_cache_path() -> Path:
+    """Return the on-disk location of the TCP discovery cache."""
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "seymourlib" / "discovery.json"
+
+
+async def load_cached_tcp_transports(
+    interface_ip: str | None = None,
+    ttl: float = DEFAULT_CACHE_TTL,
+    path: Path | None = None,
+) -> list[TCPTransportCandidate]:
+    """Return TCP transports seen by a previous discovery within the last ``ttl`` seconds.
+
+    A missing or unreadable cache is treated as empty.
+    """
+
+    cache = await asyncio.to_thread(_read_cache, path or default_cache_path())
+    now = time.time()
+    entries = cache.get(interface_ip or "", {})
+    if not isinstance(entries, dict):
+        return []
+
+    candidates: list[TCPTransportCandidate] = []
+    for host, entry in entries.items():
+        if not isinstance(entry, dict):
+            continue
+        try:
+            if now - float(entry["timestamp"]) >= ttl:
+                continue
+            port = int(entry["port"])
+            candidates.append(
+                TCPTransportCandidate(
+                    transport=TCPTransport(host, port),
+                    host=host,
+                    port=port,
+                    metadata=dict(entry["metadata"]),
+                    raw_beacon=str(entry["raw_beacon"]),
+                )
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    return sorted(candidates, key=lambda candidate: candidate.host)
+
+
+async def store_cached_tcp_transports(
+    candidates: list[TCPTransportCandidate],
+    interface_ip: str | None = None,
+    path: Path | None = None,
+) -> None:
+    """Record freshly discovered TCP transports so later lookups can skip the listen interval."""
+
+    cache_path = path or default_cache_path()
+    now = time.time()
+    entries = {
+        candidate.host: {
+            "timestamp": now,
+            "port": candidate.port,
+            "metadata": candidate.metadata,
+            "raw_beacon": candidate.raw_beacon,
+        }
+        for candidate in candidates
+    }
+
+    def _update() -> None:
+        cache = _read_cache(cache_path)
+        cache[interface_ip or ""] = entries
+        _write_cache(cache_path, cache)
+
+    await asyncio.to_thread(_update)
+
+
+def _read_cache(path: Path) -> dict[str, Any]:
+    """Load the discovery cache, returning an empty cache if it is missing or corrupt.
+
+    Only the top level is validated; callers must check the shape of anything below it.
+    """
+
+    try:
+        with path.open(encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(path: Path, cache: dict[str, Any]) -> None:
+    """Atomically replace the discovery cache file."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temp name per writer, so concurrent discoveries never publish each other's
+    # half-written file.
+    tmp = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", delete=False
+    )
+    try:
+        with tmp:
+            json.dump(cache, tmp)
+        os.replace(tmp.name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp.name)
+        raise
+
+
+def _candidate_from_beacon(host: str, payload: bytes) -> TCPTransportCandidate:
+    """Build a TCP candidate for the device that sent a discovery beacon."""
+
+    raw_text, metadata = _decode_beacon(payload)
+    return TCPTransportCandidate(
+        transport=TCPTransport(host, ITACH_SERIAL_PORT),
+        host=host,
+        port=ITACH_SERIAL_PORT,
+        metadata=metadata,
+        raw_beacon=raw_text,
+    )
+
+
+def _decode_beacon(payload: bytes) -> tuple[str, dict[str, str]]:
+    """Return a beacon's text and its parsed fields (empty if it is not a valid AMXB beacon)."""
+
+    raw_text = _safe_decode(payload)
+    try:
+        return raw_text, _parse_amxb_payload(raw_text)
+    except ValueError:
+        return raw_text, {}
+
+
 def _safe_decode(payload: bytes) -> str:
-    """Decode beacon payload to readable ASCII, preserving printable text."""
+    """Decode beacon payload text; beacons are ASCII, and latin-1 maps any stray byte 1:1."""
 
-    return payload.decode("ascii", errors="replace").strip()
+    return payload.decode("latin-1").strip()
 
 
 def _parse_amxb_payload(raw_text: str) -> dict[str, str]:
@@ -162,19 +307,7 @@ def _parse_amxb_payload(raw_text: str) -> dict[str, str]:
     if not raw_text.startswith("AMXB"):
         raise ValueError("Not a Global Caché beacon")
 
-    fields: dict[str, str] = {}
-    parts = raw_text.split("<-")
-    for part in parts[1:]:
-        clean_part = part.rstrip("> \r\n\t")
-        if not clean_part:
-            continue
-
-        if "=" in clean_part:
-            key, value = clean_part.split("=", 1)
-            fields[key] = value
-        else:
-            fields[clean_part] = ""
-
+    fields = {match.group(1): match.group(2) or "" for match in _AMXB_FIELD_RE.finditer(raw_text)}
     if not fields:
         raise ValueError("Unable to parse beacon contents")
 
@@ -193,7 +326,7 @@ def _create_multicast_socket(interface_ip: str | None) -> socket.socket:
     else:
         interface_bytes = socket.inet_aton("0.0.0.0")
 
-    mreq = struct.pack("=4s4s", socket.inet_aton(MCAST_GROUP), interface_bytes)
+    mreq = _MREQ_STRUCT.pack(socket.inet_aton(MCAST_GROUP), interface_bytes)
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
     return sock
 
@@ -5,6 +5,7 @@ Implementation for the Seymour RS232 protocol version 01.
 from __future__ import annotations
 
 import enum
+import functools
 import re
 
 import attrs
@@ -22,9 +23,12 @@ class SingleByte(enum.StrEnum):
     """
 
     @classmethod
+    @functools.cache
     def regex(cls, n: int | None = None) -> bytes:
         """
         Regular expression that parses exactly one code value into a capture group named after the class.
+
+        Results are memoized per (class, n), since decoders request the same fragments repeatedly.
         """
         all_commands = "".join(code.value for code in cls)
         capture_group_suffix = str(n) if n is not None else ""
@@ -82,7 +86,9 @@ class Ratio:
     def check(self, _attribute: attrs.Attribute[str], value: str) -> None:
         if len(value) != 3:
             raise ValueError("ratio_id must be three digits long")
-        if not value.isdigit():
+        # isascii() is a constant-time flag check and keeps isdigit() from accepting
+        # non-ASCII digits such as "١٢٣", which could never be encoded into a frame.
+        if not (value.isascii() and value.isdigit()):
             raise ValueError("ratio_id must be numeric")
 
     @classmethod
@@ -92,6 +98,18 @@ class Ratio:
         """
         return rb"(?P<Ratio>[0-9]{3})"
 
+    @classmethod
+    def _from_digits(cls, digits: bytes) -> Ratio:
+        """
+        Build a Ratio from three bytes the caller has already checked are ASCII digits.
+
+        Decoders validate the ID while parsing the frame, so this skips running the
+        validator a second time; everything else should construct Ratio normally.
+        """
+        ratio = object.__new__(cls)
+        object.__setattr__(ratio, "id", digits.decode("ascii"))
+        return ratio
+
 
 @attrs.frozen
 class MaskStatus:
@@ -105,6 +123,11 @@ class MaskPosition:
     position_pct: float
 
 
+_SERIAL_NUMBER_PATTERN = (
+    rb"(?P<model_code>.{2})-(?P<month>[0-9]{2})(?P<year>[0-9]{2})-(?P<production_number>.{5})"
+)
+
+
 @attrs.frozen
 class Serial:
     model_code: str
@@ -115,9 +138,7 @@ class Serial:
     def to_serial_number(self) -> str:
         return f"{self.model_code}-{self.month:02d}{self.year:02d}-{self.production_number}"
 
-    PARSER_RE = re.compile(
-        rb"(?P<model_code>.{2})-(?P<month>[0-9]{2})(?P<year>[0-9]{2})-(?P<production_number>.{5})"
-    )
+    PARSER_RE = re.compile(_SERIAL_NUMBER_PATTERN)
 
     @staticmethod
     def from_serial_number(serial_number: bytes) -> Serial:
@@ -130,16 +151,18 @@ class Serial:
         match = Serial.PARSER_RE.fullmatch(serial_number)
         if not match:
             raise SeymourProtocolError(f"Malformed serial number: {serial_number!r}")
+        return Serial._from_match(match)
 
-        model_code = match.group("model_code").decode("ascii")
-        month = int(match.group("month"))
-        year = int(match.group("year"))
-        production_number = match.group("production_number").decode("ascii")
+    @staticmethod
+    def _from_match(match: re.Match[bytes]) -> Serial:
+        """
+        Build a Serial from a match of any pattern that embeds `_SERIAL_NUMBER_PATTERN`.
+        """
         return Serial(
-            model_code=model_code,
-            month=month,
-            year=year,
-            production_number=production_number,
+            model_code=match.group("model_code").decode("ascii"),
+            month=int(match.group("month")),
+            year=int(match.group("year")),
+            production_number=match.group("production_number").decode("ascii"),
         )
 
 
@@ -152,6 +175,23 @@ class SystemInfo:
     mask_ids: list[MotorID]
 
 
+_UNSIGNED_FLOAT_CHARS = b"0123456789."
+_SIGNED_FLOAT_CHARS = b"0123456789.-"
+
+
+def _parse_ascii_float(field: bytes, allowed: bytes) -> float:
+    """
+    Parse a fixed-width ASCII number, rejecting any byte outside `allowed`.
+
+    float() alone would also accept whitespace, exponents, "inf", etc.
+    """
+    # strip() leaves something behind only if a byte outside `allowed` stops it, and unlike
+    # translate() it returns the shared empty bytes object rather than allocating a copy.
+    if field.strip(allowed):
+        raise ValueError(f"Unexpected characters in numeric field: {field!r}")
+    return float(field)
+
+
 @attrs.frozen
 class RatioSetting:
     ratio: Ratio
@@ -176,33 +216,48 @@ class RatioSetting:
         - For each motor:
           - 4 bytes: position adjustment percentage (ASCII float)
         """
-        base_pattern = Ratio.regex() + rb"(?P<label>.{8})(?P<width>[0-9.]{6})(?P<height>[0-9.]{6})"
-
-        pattern = base_pattern + _ASCII_PCT_RE * num_motors * 2
-
-        match = re.fullmatch(pattern, entry)
-        if not match:
+        expected_length = RatioSetting.expected_entry_length(num_motors)
+        if len(entry) != expected_length:
             raise SeymourProtocolError(
-                f"Malformed ratio setting entry for pattern {pattern!r}: {entry!r}"
+                f"Malformed ratio setting entry (expected {expected_length} bytes): {entry!r}"
             )
 
-        ratio_id = match.group("Ratio").decode("ascii")
-        label = match.group("label").decode("ascii").strip()
-        width = float(match.group("width"))
-        height = float(match.group("height"))
-
-        # parse the motor positions and adjustments
-        motor_positions_pct: list[float] = []
-        motor_adjustments_pct: list[float] = []
-        position_group_start = 5  # after ratio, label, width, height
-        for i in range(num_motors):
-            pos_str = match.group(position_group_start + i)
-            adj_str = match.group(position_group_start + num_motors + i)
-            motor_positions_pct.append(float(pos_str))
-            motor_adjustments_pct.append(float(adj_str))
+        return RatioSetting._parse_at(entry, 0, num_motors)
+
+    @staticmethod
+    def _parse_at(buffer: bytes, start: int, num_motors: int) -> RatioSetting:
+        """
+        Parse the entry beginning at `start` in a buffer known to hold a whole entry there.
+
+        Fields are sliced straight out of `buffer`, so a settings response can be decoded
+        without first copying each entry into its own bytes object.
+        """
+        positions_start = start + 23
+        adjustments_start = positions_start + num_motors * 4
+        end = adjustments_start + num_motors * 4
+        try:
+            ratio_id = buffer[start : start + 3]
+            if not ratio_id.isdigit():
+                raise ValueError(f"Ratio ID must be numeric: {ratio_id!r}")
+            ratio = Ratio._from_digits(ratio_id)
+            label = buffer[start + 3 : start + 11].decode("ascii").strip()
+            width = _parse_ascii_float(buffer[start + 11 : start + 17], _UNSIGNED_FLOAT_CHARS)
+            height = _parse_ascii_float(buffer[start + 17 : start + 23], _UNSIGNED_FLOAT_CHARS)
+            motor_positions_pct = [
+                _parse_ascii_float(buffer[offset : offset + 4], _SIGNED_FLOAT_CHARS)
+                for offset in range(positions_start, adjustments_start, 4)
+            ]
+            motor_adjustments_pct = [
+                _parse_ascii_float(buffer[offset : offset + 4], _SIGNED_FLOAT_CHARS)
+                for offset in range(adjustments_start, end, 4)
+            ]
+        except ValueError as exc:
+            raise SeymourProtocolError(
+                f"Malformed ratio setting entry: {buffer[start:end]!r}"
+            ) from exc
 
         return RatioSetting(
-            ratio=Ratio(ratio_id),
+            ratio=ratio,
             label=label,
             width_inches=width,
             height_inches=height,
@@ -233,114 +288,196 @@ def _frame(payload: str) -> bytes:
     return FRAME_START + PROTOCOL_VERSION + payload.encode("ascii") + FRAME_END
 
 
+# Encoders run on every request, so the pieces they splice together are encoded once at import.
+_FRAME_PREFIX = FRAME_START + PROTOCOL_VERSION
+_COMMAND_PREFIX = {code: _FRAME_PREFIX + code.value.encode("ascii") for code in CommandCode}
+_MOTOR_BYTES = {motor: motor.value.encode("ascii") for motor in MotorID}
+_MOVEMENT_BYTES = {movement: movement.value.encode("ascii") for movement in MovementCode}
+_DIAGNOSTIC_OPTION_BYTES = {option: option.value.encode("ascii") for option in DiagnosticOption}
+
+_STATUS_FRAME = _frame(CommandCode.STATUS)
+_POSITIONS_FRAME = _frame(CommandCode.POSITIONS)
+_READ_SYSINFO_FRAME = _frame(CommandCode.READ_SYSTEM_INFO)
+_READ_SETTINGS_FRAME = _frame(CommandCode.READ_SETTINGS)
+_CLEAR_ALL_SETTINGS_FRAME = _frame(CommandCode.CLEAR_SETTINGS)
+_DIAGNOSTICS_PREFIX = (
+    _FRAME_PREFIX + f"{CommandCode.DIAGNOSTICS}{DiagnosticCommand.DEBUG_LOG}".encode("ascii")
+)
+
+
+# Commands whose arguments are all enums have only a handful of possible frames, so build
+# every one up front and let the encoders return them with a single lookup.
+def _movement_frames(command: CommandCode) -> dict[tuple[MotorID, MovementCode], bytes]:
+    return {
+        (motor, movement): _COMMAND_PREFIX[command]
+        + _MOTOR_BYTES[motor]
+        + _MOVEMENT_BYTES[movement]
+        + FRAME_END
+        for motor in MotorID
+        for movement in MovementCode
+    }
+
+
+_MOVE_OUT_FRAMES = _movement_frames(CommandCode.MOVE_OUT)
+_MOVE_IN_FRAMES = _movement_frames(CommandCode.MOVE_IN)
+
+
+def _motor_frames(command: CommandCode) -> dict[MotorID, bytes]:
+    return {motor: _COMMAND_PREFIX[command] + _MOTOR_BYTES[motor] + FRAME_END for motor in MotorID}
+
+
+_HOME_FRAMES = _motor_frames(CommandCode.HOME)
+_HALT_FRAMES = _motor_frames(CommandCode.HALT)
+_CALIBRATE_FRAMES = _motor_frames(CommandCode.CALIBRATE)
+_DIAGNOSTICS_FRAMES = {
+    option: _DIAGNOSTICS_PREFIX + _DIAGNOSTIC_OPTION_BYTES[option] + FRAME_END
+    for option in DiagnosticOption
+}
+
+
+# A Ratio can take a thousand values, too many to tabulate, so each ratio command gets a
+# precomputed template instead; filling one is a single C-level bytes formatting call.
+def _ratio_template(command: CommandCode) -> bytes:
+    return _COMMAND_PREFIX[command] + b"%b" + FRAME_END
+
+
+_MOVE_TO_RATIO_TEMPLATE = _ratio_template(CommandCode.MOVE_TO_RATIO)
+_UPDATE_RATIO_TEMPLATE = _ratio_template(CommandCode.UPDATE_RATIO)
+_CLEAR_SETTINGS_TEMPLATE = _ratio_template(CommandCode.CLEAR_SETTINGS)
+
+
 def encode_move_out(motor_id: MotorID, movement: MovementCode) -> bytes:
-    return _frame(f"{CommandCode.MOVE_OUT}{motor_id}{movement}")
+    return _MOVE_OUT_FRAMES[motor_id, movement]
 
 
 def encode_move_in(motor_id: MotorID, movement: MovementCode) -> bytes:
-    return _frame(f"{CommandCode.MOVE_IN}{motor_id}{movement}")
+    return _MOVE_IN_FRAMES[motor_id, movement]
 
 
 def encode_move_ratio(ratio: Ratio) -> bytes:
-    return _frame(f"{CommandCode.MOVE_TO_RATIO}{ratio.id}")
+    return _MOVE_TO_RATIO_TEMPLATE % ratio.id.encode("ascii")
 
 
 def encode_home(motor_id: MotorID) -> bytes:
-    return _frame(f"{CommandCode.HOME}{motor_id}")
+    return _HOME_FRAMES[motor_id]
 
 
 def encode_halt(motor_id: MotorID) -> bytes:
-    return _frame(f"{CommandCode.HALT}{motor_id}")
+    return _HALT_FRAMES[motor_id]
 
 
 def encode_calibrate(motor_id: MotorID) -> bytes:
-    return _frame(f"{CommandCode.CALIBRATE}{motor_id}")
+    return _CALIBRATE_FRAMES[motor_id]
 
 
 def encode_status() -> bytes:
-    return _frame(CommandCode.STATUS)
+    return _STATUS_FRAME
 
 
 def encode_positions() -> bytes:
-    return _frame(CommandCode.POSITIONS)
+    return _POSITIONS_FRAME
 
 
 def encode_update_ratio(ratio: Ratio) -> bytes:
-    return _frame(f"{CommandCode.UPDATE_RATIO}{ratio.id}")
+    return _UPDATE_RATIO_TEMPLATE % ratio.id.encode("ascii")
 
 
 def encode_clear_settings(ratio: Ratio | None) -> bytes:
-    id = ratio.id if ratio is not None else ""
-    return _frame(f"{CommandCode.CLEAR_SETTINGS}{id}")
+    if ratio is None:
+        return _CLEAR_ALL_SETTINGS_FRAME
+    return _CLEAR_SETTINGS_TEMPLATE % ratio.id.encode("ascii")
 
 
 def encode_read_sysinfo() -> bytes:
-    return _frame(CommandCode.READ_SYSTEM_INFO)
+    return _READ_SYSINFO_FRAME
 
 
 def encode_read_settings() -> bytes:
-    return _frame(CommandCode.READ_SETTINGS)
+    return _READ_SETTINGS_FRAME
 
 
 def encode_diagnostics(option: DiagnosticOption) -> bytes:
-    return _frame(f"{CommandCode.DIAGNOSTICS}{DiagnosticCommand.DEBUG_LOG}{option}")
+    return _DIAGNOSTICS_FRAMES[option]
 
 
-def _frame_re(regex_body: bytes) -> re.Pattern[bytes]:
-    regex = b"^\\" + FRAME_START + PROTOCOL_VERSION + regex_body + b"\\" + FRAME_END + b"$"
-    return re.compile(regex)
+def _unframe(raw: bytes) -> bytes | None:
+    """
+    Return the payload between the frame delimiters, or None if `raw` is not a v01 frame.
 
+    The envelope is fixed, so it is checked with plain byte comparisons and the decoders
+    only need to run their payload patterns.
+    """
+    if len(raw) <= len(_FRAME_PREFIX) or not raw.startswith(_FRAME_PREFIX):
+        return None
+    if not raw.endswith(FRAME_END):
+        return None
+    return raw[len(_FRAME_PREFIX) : -len(FRAME_END)]
 
-_STATUS_RE = _frame_re(StatusCode.regex() + Ratio.regex() + rb"?")
+
+_STATUS_BY_BYTE = {ord(code.value): code for code in StatusCode}
+_RATIO_ID_LENGTH = 3
 
 
 def decode_status(raw: bytes) -> MaskStatus:
-    match = _STATUS_RE.match(raw)
-    if not match:
+    # A status payload is one code byte, optionally followed by a three-digit ratio ID, so
+    # it is validated by position and lookup rather than with a regex.
+    payload = _unframe(raw)
+    if not payload:
+        raise SeymourProtocolError(f"Malformed status response: {raw!r}")
+    code = _STATUS_BY_BYTE.get(payload[0])
+    if code is None:
         raise SeymourProtocolError(f"Malformed status response: {raw!r}")
-    status_code = match.group("StatusCode").decode("ascii")
-    maybe_ratio_str = match.group("Ratio")
-    ratio = Ratio(maybe_ratio_str.decode("ascii")) if maybe_ratio_str is not None else None
-    return MaskStatus(code=StatusCode(status_code), ratio=ratio)
+    if len(payload) == 1:
+        return MaskStatus(code=code)
+    ratio_id = payload[1:]
+    if len(ratio_id) != _RATIO_ID_LENGTH or not ratio_id.isdigit():
+        raise SeymourProtocolError(f"Malformed status response: {raw!r}")
+    return MaskStatus(code=code, ratio=Ratio._from_digits(ratio_id))
 
 
-_POSITIONS_RE = _frame_re(rb"(?P<num_motors>[1-4])(?P<entries>.+)")
-_ASCII_PCT_RE = rb"([0-9.\-]{4})"
+_POSITIONS_RE = re.compile(rb"(?P<num_motors>[1-4])(?P<entries>.+)")
+_POSITION_ENTRY_LENGTH = 5  # 1 byte motor ID + 4 bytes ASCII percentage
+_MOTOR_BY_BYTE = {ord(motor.value): motor for motor in MotorID}
 
 
 def decode_positions(raw: bytes) -> list[MaskPosition]:
-    match = _POSITIONS_RE.match(raw)
+    payload = _unframe(raw)
+    match = _POSITIONS_RE.fullmatch(payload) if payload is not None else None
     if not match:
         raise SeymourProtocolError(f"Malformed positions response: {raw!r}")
     num_motors = int(match.group("num_motors"))
     entries_str = match.group("entries")
-
-    pattern = b"".join(MotorID.regex(i) + _ASCII_PCT_RE for i in range(num_motors))
-    match = re.fullmatch(pattern, entries_str)
-    if not match:
+    if len(entries_str) != num_motors * _POSITION_ENTRY_LENGTH:
         raise SeymourProtocolError(f"Malformed motor position entries: {entries_str!r}")
-    if len(match.groups()) != num_motors * 2:
-        raise SeymourProtocolError(f"Expected {num_motors} motor entries, got: {entries_str!r}")
+
     positions: list[MaskPosition] = []
-    for i in range(num_motors):
-        motor_id_str = match.group(1 + i * 2).decode("ascii")
-        position_str = match.group(2 + i * 2).decode("ascii")
-        positions.append(
-            MaskPosition(
-                motor_id=MotorID(motor_id_str),
-                position_pct=float(position_str),
+    for offset in range(0, len(entries_str), _POSITION_ENTRY_LENGTH):
+        motor_id = _MOTOR_BY_BYTE.get(entries_str[offset])
+        if motor_id is None:
+            raise SeymourProtocolError(f"Malformed motor position entries: {entries_str!r}")
+        try:
+            position_pct = _parse_ascii_float(
+                entries_str[offset + 1 : offset + _POSITION_ENTRY_LENGTH], _SIGNED_FLOAT_CHARS
             )
-        )
+        except ValueError as exc:
+            raise SeymourProtocolError(
+                f"Malformed motor position entries: {entries_str!r}"
+            ) from exc
+        positions.append(MaskPosition(motor_id=motor_id, position_pct=position_pct))
     return positions
 
 
-_SYSTEM_INFO_RE = _frame_re(
-    rb"(?P<model>.{20})(?P<width>[0-9.]{6})(?P<height>[0-9.]{6})(?P<serial>.{13})(?P<mask_ids>[LRTB]{1,5})"
+# The serial number's sub-pattern is inlined so a single match yields every field.
+_SYSTEM_INFO_RE = re.compile(
+    rb"(?P<model>.{20})(?P<width>[0-9.]{6})(?P<height>[0-9.]{6})"
+    + _SERIAL_NUMBER_PATTERN
+    + rb"(?P<mask_ids>[LRTB]{1,5})"
 )
 
 
 def decode_system_info(raw: bytes) -> SystemInfo:
-    match = _SYSTEM_INFO_RE.match(raw)
+    payload = _unframe(raw)
+    match = _SYSTEM_INFO_RE.fullmatch(payload) if payload is not None else None
     if not match:
         raise SeymourProtocolError(f"Malformed system info response: {raw!r}")
     model = match.group("model").decode("ascii").strip()
@@ -348,11 +485,9 @@ def decode_system_info(raw: bytes) -> SystemInfo:
     width = float(match.group("width"))
     height = float(match.group("height"))
 
-    serial_str = match.group("serial")
-    serial = Serial.from_serial_number(serial_str)
+    serial = Serial._from_match(match)
 
-    mask_ids_str = match.group("mask_ids").decode("ascii")
-    mask_ids = [MotorID(c) for c in mask_ids_str]
+    mask_ids = [_MOTOR_BY_BYTE[c] for c in match.group("mask_ids")]
 
     return SystemInfo(
         screen_model=model,
@@ -363,11 +498,12 @@ def decode_system_info(raw: bytes) -> SystemInfo:
     )
 
 
-_SETTINGS_RE = _frame_re(rb"(?P<num_motors>[0-9])(?P<num_ratios>[0-9]{2})(?P<entries>.+)")
+_SETTINGS_RE = re.compile(rb"(?P<num_motors>[0-9])(?P<num_ratios>[0-9]{2})(?P<entries>.+)")
 
 
 def decode_settings(raw: bytes) -> list[RatioSetting]:
-    match = _SETTINGS_RE.match(raw)
+    payload = _unframe(raw)
+    match = _SETTINGS_RE.fullmatch(payload) if payload is not None else None
     if not match:
         raise SeymourProtocolError(f"Malformed settings response: {raw!r}")
     num_motors = int(match.group("num_motors"))
@@ -381,12 +517,7 @@ def decode_settings(raw: bytes) -> list[RatioSetting]:
             f"got total length {len(entries_str)}: {entries_str!r}"
         )
 
-    settings: list[RatioSetting] = []
-    for i in range(num_ratios):
-        entry_bytes = entries_str[
-            i * expected_length_per_entry : (i + 1) * expected_length_per_entry
-        ]
-        setting = RatioSetting.from_response_entry(entry_bytes, num_motors)
-        settings.append(setting)
-
-    return settings
+    return [
+        RatioSetting._parse_at(entries_str, offset, num_motors)
+        for offset in range(0, len(entries_str), expected_length_per_entry)
+    ]
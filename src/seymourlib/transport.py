@@ -3,20 +3,38 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import socket
 from abc import abstractmethod
+from typing import Any
 
 from .exceptions import SeymourTransportError
 
+_LOGGER = logging.getLogger(__name__)
+
 SEYMOUR_BAUD_RATE = 115200
 ITACH_SERIAL_PORT = 4999
 
+_FRAME_END = ord("]")
+_READ_CHUNK_SIZE = 4096
+# The IP2SL tunnels a 115200-baud serial line (~11.5 KB/s), so kernel buffers sized for bulk
+# transfer only give stale bytes somewhere to pile up.
+_TCP_RECEIVE_BUFFER = 8192
+_TCP_SEND_BUFFER = 4096
+
 
 class SeymourTransport:
     """Abstract transport used by the SeymourClient."""
 
+    __slots__ = ("reader", "writer", "_rxbuf", "_scan_pos")
+
     def __init__(self) -> None:
         self.reader: asyncio.StreamReader | None = None
         self.writer: asyncio.StreamWriter | None = None
+        # Bytes read from the stream but not yet returned as a frame, and how far into
+        # them we have already looked for a frame end.
+        self._rxbuf = bytearray()
+        self._scan_pos = 0
 
     @abstractmethod
     async def connect(self) -> None:
@@ -30,11 +48,16 @@ class SeymourTransport:
         finally:
             self.writer = None
             self.reader = None
+            self._rxbuf.clear()
+            self._scan_pos = 0
 
     async def send(self, data: bytes) -> None:
         """Send one data frame to transport, blocking until the complete frame is sent."""
-        assert data.startswith(b"["), "Frame must start with '['"
-        assert data.endswith(b"]"), "Frame must end with ']'"
+        # Indexing bytes yields small ints, so a well-formed frame costs two integer
+        # comparisons; the per-condition asserts only run to report a bad frame.
+        if __debug__ and not (data and data[0] == 0x5B and data[-1] == 0x5D):  # "[", "]"
+            assert data.startswith(b"["), "Frame must start with '['"
+            assert data.endswith(b"]"), "Frame must end with ']'"
 
         if not self.writer:
             raise SeymourTransportError("Not connected")
@@ -48,14 +71,52 @@ class SeymourTransport:
 
         Note: no timeout here; caller should use structured concurrency if desired.
         """
+        end = await self._await_frame_end()
+        frame = bytes(self._rxbuf[: end + 1])
+        self._consume(end + 1)
+        return frame
+
+    async def receive_into(self, out: memoryview) -> int:
+        """
+        Copy one data frame into ``out``, blocking until frame end (']') is received.
+
+        Returns the frame length.  Unlike receive(), no bytes object is allocated, so callers
+        that parse in place can reuse one buffer across requests.  If ``out`` is too small
+        the frame is left buffered and SeymourTransportError is raised.
+        """
+        end = await self._await_frame_end()
+        length = end + 1
+        if length > len(out):
+            raise SeymourTransportError(
+                f"Receive buffer too small: frame is {length} bytes, buffer is {len(out)}"
+            )
+
+        out[:length] = self._rxbuf[:length]
+        self._consume(length)
+        return length
+
+    async def _await_frame_end(self) -> int:
+        """Read until the receive buffer holds a complete frame; return the index of its ']'."""
         if not self.reader:
             raise SeymourTransportError("Not connected")
 
-        try:
-            data = await asyncio.wait_for(self.reader.readuntil(b"]"), timeout=None)
-            return data
-        except asyncio.IncompleteReadError as exc:
-            raise SeymourTransportError("Connection closed") from exc
+        # Keep our own buffer rather than using StreamReader.readuntil(): each pass scans only
+        # bytes not yet looked at, and one read spanning several frames is split locally.
+        while True:
+            end = self._rxbuf.find(_FRAME_END, self._scan_pos)
+            if end >= 0:
+                return end
+
+            self._scan_pos = len(self._rxbuf)
+            chunk = await self.reader.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                raise SeymourTransportError("Connection closed")
+            self._rxbuf += chunk
+
+    def _consume(self, length: int) -> None:
+        """Drop a returned frame from the front of the receive buffer."""
+        del self._rxbuf[:length]
+        self._scan_pos = 0
 
     async def drain_read_buffer(self) -> bytes:
         """Discard any stale bytes sitting in the receive buffer.
@@ -65,25 +126,50 @@ class SeymourTransport:
         the next ``receive()`` to return a frame belonging to a previous
         request.
         """
-        if not self.reader:
-            return b""
-
-        drained = b""
-        # StreamReader buffers incoming data internally.  A non-blocking
-        # read of whatever is already buffered is safe; we set a tiny
-        # timeout so that we never actually block waiting for the device.
-        while True:
-            try:
-                chunk = await asyncio.wait_for(self.reader.read(4096), timeout=0.01)
+        # Accumulate into the receive buffer, which may already hold bytes receive() pulled off
+        # the stream but never returned, so the drained data is copied out exactly once.
+        if self.reader and not self._take_stream_buffer():
+            # StreamReader buffers incoming data internally.  A non-blocking
+            # read of whatever is already buffered is safe; we set a tiny
+            # timeout so that we never actually block waiting for the device.
+            while True:
+                try:
+                    async with asyncio.timeout(0.01):
+                        chunk = await self.reader.read(_READ_CHUNK_SIZE)
+                except TimeoutError:
+                    break
                 if not chunk:
                     break
-                drained += chunk
-            except TimeoutError:
-                break
+                self._rxbuf += chunk
+
+        drained = bytes(self._rxbuf)
+        self._rxbuf.clear()
+        self._scan_pos = 0
         return drained
 
+    def _take_stream_buffer(self) -> bool:
+        """Move everything the StreamReader has buffered into our receive buffer, without waiting.
+
+        The timed read() fallback in drain_read_buffer() waits out its full timeout whenever
+        nothing is buffered, which is the normal case before a send, so it would put a 10 ms
+        floor under every request.  asyncio.StreamReader keeps its data in a private bytearray
+        that can be taken directly; returns False for readers that don't (e.g. test doubles).
+        """
+        buffered = getattr(self.reader, "_buffer", None)
+        resume = getattr(self.reader, "_maybe_resume_transport", None)
+        if not isinstance(buffered, bytearray) or resume is None:
+            return False
+
+        self._rxbuf += buffered
+        buffered.clear()
+        # Reading may have been paused because the buffer hit its limit; let it continue.
+        resume()
+        return True
+
 
 class TCPTransport(SeymourTransport):
+    __slots__ = ("host", "port")
+
     def __init__(self, host: str, port: int = ITACH_SERIAL_PORT) -> None:
         super().__init__()
         self.host = host
@@ -95,9 +181,25 @@ class TCPTransport(SeymourTransport):
         # a leaked socket holds that slot and blocks all future connects.
         await self.close()
         self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self._configure_socket()
+
+    def _configure_socket(self) -> None:
+        """Tune the connected socket for small, latency-sensitive request/response frames."""
+        # asyncio hands out a TransportSocket wrapper here, not the socket.socket itself
+        sock = self.writer.get_extra_info("socket") if self.writer else None
+        if sock is None:
+            return
+
+        # The default event loop already disables Nagle for TCP streams, but that's an
+        # implementation detail; without it every command could wait on a delayed ACK.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _TCP_RECEIVE_BUFFER)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _TCP_SEND_BUFFER)
 
 
 class SerialTransport(SeymourTransport):
+    __slots__ = ("port", "baudrate")
+
     def __init__(self, port: str, baudrate: int = SEYMOUR_BAUD_RATE) -> None:
         super().__init__()
         self.port = port
@@ -105,11 +207,41 @@ class SerialTransport(SeymourTransport):
 
     async def connect(self) -> None:
         await self.close()
-        try:
-            import serial_asyncio
-        except Exception as exc:
-            raise SeymourTransportError("serial_asyncio not installed") from exc
-
+        serial_asyncio = _load_serial_asyncio()
         self.reader, self.writer = await serial_asyncio.open_serial_connection(
             url=self.port, baudrate=self.baudrate
         )
+        self._enable_low_latency()
+
+    def _enable_low_latency(self) -> None:
+        """Ask the kernel to hand over received bytes immediately, where supported.
+
+        USB-serial adapters (notably FTDI) batch incoming bytes for up to 16 ms by default,
+        which puts a floor under every request/response round-trip.  Only Linux exposes a
+        knob for this; elsewhere, or if the driver refuses, we carry on with the default.
+        """
+        import serial
+
+        port = getattr(getattr(self.writer, "transport", None), "serial", None)
+        if not isinstance(port, serial.Serial) or not hasattr(port, "set_low_latency_mode"):
+            return
+
+        try:
+            port.set_low_latency_mode(True)
+        except (ValueError, OSError) as exc:
+            _LOGGER.debug("Unable to enable low-latency mode on %s: %s", self.port, exc)
+
+
+def _load_serial_asyncio() -> Any:
+    """Return serial_asyncio for environments with the ``serial`` extra installed.
+
+    Deliberately imported on first use rather than at module load: TCP-only users
+    shouldn't pay for pyserial, and once loaded a repeat import is a sys.modules lookup.
+    """
+
+    try:
+        import serial_asyncio
+    except ImportError as exc:
+        raise SeymourTransportError("serial_asyncio not installed") from exc
+
+    return serial_asyncio
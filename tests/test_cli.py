@@ -0,0 +1,481 @@
+"""Tests for the seymourctl command-line interface."""
+
+import asyncio
+import contextlib
+import logging
+import os
+import subprocess
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from seymourlib import cli, protocol
+from seymourlib.client import SeymourClient
+from seymourlib.discovery import (
+    DiscoveryError,
+    SerialTransportCandidate,
+    TCPTransportCandidate,
+    store_cached_tcp_transports,
+)
+from seymourlib.exceptions import SeymourProtocolError
+from seymourlib.transport import ITACH_SERIAL_PORT, SEYMOUR_BAUD_RATE, SerialTransport, TCPTransport
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def client() -> Iterator[AsyncMock]:
+    """Install a mock client that every command will use instead of opening a transport."""
+    mock_client = AsyncMock(spec=SeymourClient)
+    token = cli._client_factory.set(lambda: contextlib.nullcontext(mock_client))
+    yield mock_client
+    cli._client_factory.reset(token)
+
+
+@pytest.fixture
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the discovery cache at a scratch directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def enumerate_tcp() -> Iterator[AsyncMock]:
+    """Replace the multicast listen with a mock returning no devices."""
+    with patch.object(cli, "enumerate_tcp_transports", AsyncMock(return_value=[])) as mock:
+        yield mock
+
+
+@pytest.fixture
+def enumerate_serial() -> Iterator[AsyncMock]:
+    """Replace the serial port scan with a mock returning no ports."""
+    with patch.object(cli, "enumerate_serial_transports", AsyncMock(return_value=[])) as mock:
+        yield mock
+
+
+@pytest.fixture
+def dashboard_client(client: AsyncMock) -> AsyncMock:
+    """Give the mock client one reading for each of the dashboard's four getters."""
+    client.get_status.return_value = protocol.MaskStatus(
+        code=protocol.StatusCode.STOPPED_AT_RATIO, ratio=protocol.Ratio("235")
+    )
+    client.get_positions.return_value = [
+        protocol.MaskPosition(motor_id=protocol.MotorID.TOP, position_pct=12.5),
+        protocol.MaskPosition(motor_id=protocol.MotorID.BOTTOM, position_pct=87.5),
+    ]
+    client.get_ratio_settings.return_value = [
+        protocol.RatioSetting(
+            ratio=protocol.Ratio("235"),
+            label="Scope",
+            width_inches=120.0,
+            height_inches=51.1,
+            motor_positions_pct=[12.5, 87.5],
+            motor_adjustments_pct=[0.0, 0.0],
+        )
+    ]
+    client.get_system_info.return_value = protocol.SystemInfo(
+        screen_model="Titan",
+        width_inches=120.0,
+        height_inches=67.5,
+        serial_number=protocol.Serial(model_code="TI", month=3, year=24, production_number="01234"),
+        mask_ids=[protocol.MotorID.TOP, protocol.MotorID.BOTTOM],
+    )
+    return client
+
+
+def _tcp_candidate(host: str, model: str = "iTachIP2SL") -> TCPTransportCandidate:
+    return TCPTransportCandidate(
+        transport=TCPTransport(host, ITACH_SERIAL_PORT),
+        host=host,
+        port=ITACH_SERIAL_PORT,
+        metadata={"Model": model, "Status": "Ready", "UUID": f"GC-{host}"},
+        raw_beacon=f"AMXB<-UUID=GC-{host}><-Model={model}><-Status=Ready>",
+    )
+
+
+def _serial_candidate(device: str) -> SerialTransportCandidate:
+    return SerialTransportCandidate(
+        transport=SerialTransport(device, SEYMOUR_BAUD_RATE),
+        device=device,
+        baudrate=SEYMOUR_BAUD_RATE,
+        description="USB Serial",
+        hardware_id="USB VID:PID=0403:6001",
+    )
+
+
+def test_status(client: AsyncMock) -> None:
+    """Test that status prints the decoded status."""
+    client.get_status.return_value = protocol.MaskStatus(
+        code=protocol.StatusCode.STOPPED_AT_RATIO, ratio=protocol.Ratio("235")
+    )
+
+    result = runner.invoke(cli.app, ["status"])
+
+    assert result.exit_code == 0
+    assert "STOPPED_AT_RATIO" in result.output
+    client.get_status.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    ("increment", "code"),
+    [
+        pytest.param("move", protocol.MovementCode.MOVE, id="move"),
+        pytest.param("jog", protocol.MovementCode.JOG, id="jog"),
+        pytest.param("until-limit", protocol.MovementCode.UNTIL_LIMIT, id="until-limit"),
+        pytest.param("JOG", protocol.MovementCode.JOG, id="case-insensitive"),
+    ],
+)
+@pytest.mark.parametrize("direction", ["in", "out"])
+def test_positions_move_waits_for_completion(
+    client: AsyncMock, direction: str, increment: str, code: protocol.MovementCode
+) -> None:
+    """Test that motion commands send the move and poll until the motors stop."""
+    client.get_status.side_effect = [
+        protocol.MaskStatus(code=protocol.StatusCode.MOVING_INWARD),
+        protocol.MaskStatus(code=protocol.StatusCode.HALTED),
+    ]
+
+    result = runner.invoke(cli.app, ["positions", direction, "T", "--increment", increment])
+
+    assert result.exit_code == 0
+    move = client.move_in if direction == "in" else client.move_out
+    move.assert_awaited_once_with(protocol.MotorID.TOP, code)
+    assert client.get_status.await_count == 2
+
+
+def test_every_increment_maps_to_a_movement_code() -> None:
+    """Test that no Increment choice is missing from the CLI's lookup table."""
+    assert set(cli._INCREMENT_TO_CODE) == set(cli.Increment)
+
+
+@pytest.mark.parametrize("direction", ["in", "out"])
+def test_positions_rejects_unknown_increment(client: AsyncMock, direction: str) -> None:
+    """Test that an unknown increment is a usage error and nothing is sent."""
+    result = runner.invoke(cli.app, ["positions", direction, "T", "--increment", "sideways"])
+
+    assert result.exit_code == 2
+    client.move_in.assert_not_awaited()
+    client.move_out.assert_not_awaited()
+
+
+def test_preset_store_rejects_invalid_ratio(client: AsyncMock) -> None:
+    """Test that a malformed ratio ID is rejected before any client is used."""
+    result = runner.invoke(cli.app, ["preset", "store", "23a"])
+
+    assert result.exit_code == 2
+    assert "Invalid ratio ID" in result.output
+    client.update_ratio.assert_not_awaited()
+
+
+def test_preset_store(client: AsyncMock) -> None:
+    """Test that preset store forwards the parsed ratio."""
+    result = runner.invoke(cli.app, ["preset", "store", "235"])
+
+    assert result.exit_code == 0
+    client.update_ratio.assert_awaited_once_with(protocol.Ratio("235"))
+
+
+def test_dashboard(dashboard_client: AsyncMock) -> None:
+    """Test that the dashboard reads every getter once and renders all of it."""
+    result = runner.invoke(cli.app, ["dashboard"])
+
+    assert result.exit_code == 0
+    for getter in (
+        dashboard_client.get_status,
+        dashboard_client.get_positions,
+        dashboard_client.get_ratio_settings,
+        dashboard_client.get_system_info,
+    ):
+        getter.assert_awaited_once()
+    for text in ("STOPPED_AT_RATIO 235", "Titan", "TI-0324-01234", "TOP", "12.5", "87.5", "Scope"):
+        assert text in result.output
+
+
+@pytest.mark.parametrize(
+    "getter", ["get_status", "get_positions", "get_ratio_settings", "get_system_info"]
+)
+def test_dashboard_propagates_client_errors(dashboard_client: AsyncMock, getter: str) -> None:
+    """Test that a failed read aborts the dashboard instead of rendering partial data."""
+    error = SeymourProtocolError("garbled response")
+    getattr(dashboard_client, getter).side_effect = error
+
+    result = runner.invoke(cli.app, ["dashboard"])
+
+    assert result.exit_code == 1
+    assert result.exception is error
+    assert "Seymour screen" not in result.output
+
+
+def test_repl_dispatches_commands(client: AsyncMock) -> None:
+    """Test that REPL lines run the same handlers as the equivalent subcommands."""
+    client.get_status.side_effect = [
+        protocol.MaskStatus(code=protocol.StatusCode.HALTED),
+        protocol.MaskStatus(code=protocol.StatusCode.MOVING_INWARD),
+        protocol.MaskStatus(code=protocol.StatusCode.HALTED),
+        protocol.MaskStatus(code=protocol.StatusCode.MOVING_TO_RATIO),
+        protocol.MaskStatus(code=protocol.StatusCode.STOPPED_AT_RATIO, ratio=protocol.Ratio("235")),
+    ]
+
+    result = runner.invoke(
+        cli.app, ["repl"], input="status\npositions in T jog\npreset apply 235\nexit\n"
+    )
+
+    assert result.exit_code == 0
+    assert "HALTED" in result.output
+    client.move_in.assert_awaited_once_with(protocol.MotorID.TOP, protocol.MovementCode.JOG)
+    client.move_to_ratio.assert_awaited_once_with(protocol.Ratio("235"))
+    assert client.get_status.await_count == 5
+
+
+def test_repl_survives_errors(client: AsyncMock) -> None:
+    """Test that bad input and controller errors are reported without ending the session."""
+    client.get_status.side_effect = [
+        SeymourProtocolError("garbled response"),
+        protocol.MaskStatus(code=protocol.StatusCode.HALTED),
+    ]
+
+    result = runner.invoke(cli.app, ["repl"], input="bogus\npreset apply 23a\nstatus\nstatus\n")
+
+    assert result.exit_code == 0
+    assert "Unknown command: 'bogus'" in result.output
+    assert "must be numeric" in result.output
+    assert "garbled response" in result.output
+    assert "HALTED" in result.output
+    client.move_to_ratio.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "stdin",
+    [
+        pytest.param("exit\nstatus\n", id="exit"),
+        pytest.param("quit\nstatus\n", id="quit"),
+        pytest.param("\n", id="eof"),
+    ],
+)
+def test_repl_ends_session(client: AsyncMock, stdin: str) -> None:
+    """Test that exit, quit and end-of-input close the session cleanly."""
+    result = runner.invoke(cli.app, ["repl"], input=stdin)
+
+    assert result.exit_code == 0
+    client.get_status.assert_not_awaited()
+
+
+async def test_prompt_reader_reads_lines_from_fd() -> None:
+    """Test line splitting across reads, a final unterminated line, and EOF."""
+    read_fd, write_fd = os.pipe()
+    try:
+        with cli._PromptReader(asyncio.get_running_loop(), read_fd) as prompt:
+            os.write(write_fd, b"status\r\npositions")
+            assert await prompt.readline("") == "status"
+            os.write(write_fd, b" in T\nlast")
+            os.close(write_fd)
+            assert await prompt.readline("") == "positions in T"
+            assert await prompt.readline("") == "last"
+            with pytest.raises(EOFError):
+                await prompt.readline("")
+    finally:
+        os.close(read_fd)
+
+
+async def test_prompt_reader_cancels_without_a_thread() -> None:
+    """Test that a pending prompt can be cancelled, e.g. by Ctrl-C, without a blocked worker."""
+    loop = asyncio.get_running_loop()
+    read_fd, write_fd = os.pipe()
+    threads = threading.active_count()
+    try:
+        with cli._PromptReader(loop, read_fd) as prompt:
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(prompt.readline(""), 0.05)
+            assert threading.active_count() == threads
+        assert not loop.remove_reader(read_fd)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_log_records_go_to_stderr(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that log output stays out of stdout, which scripts may be parsing."""
+    cli._configure_logging(False)
+
+    logging.getLogger("seymourlib.test").warning("stale bytes drained")
+
+    captured = capsys.readouterr()
+    assert "stale bytes drained" in captured.err
+    assert "stale bytes drained" not in captured.out
+
+
+def test_log_handler_defers_rich_until_a_record_is_emitted() -> None:
+    """Test that the group callback's logging setup, which runs even for --help, skips rich."""
+    script = (
+        "import logging, sys\n"
+        "from seymourlib import cli\n"
+        "cli._configure_logging(False)\n"
+        "logging.getLogger('seymourlib').debug('filtered out by level')\n"
+        "print('rich.logging' in sys.modules)\n"
+        "logging.getLogger('seymourlib').warning('emitted')\n"
+        "print('rich.logging' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split() == ["False", "True"]
+    assert "emitted" in result.stderr
+
+
+def test_uses_uvloop_when_installed() -> None:
+    """Test that the CLI switches to uvloop's policy if it can be imported."""
+    uvloop = Mock()
+    with (
+        patch.dict("sys.modules", {"uvloop": uvloop}),
+        patch("asyncio.set_event_loop_policy") as set_policy,
+    ):
+        cli._use_uvloop()
+
+    set_policy.assert_called_once_with(uvloop.EventLoopPolicy.return_value)
+
+
+def test_keeps_default_loop_without_uvloop() -> None:
+    """Test that the CLI keeps the default loop when uvloop is missing."""
+    with (
+        patch.dict("sys.modules", {"uvloop": None}),
+        patch("asyncio.set_event_loop_policy") as set_policy,
+    ):
+        cli._use_uvloop()
+
+    set_policy.assert_not_called()
+
+
+def test_discover_tcp_uses_fresh_cache(cache_home: Path, enumerate_tcp: AsyncMock) -> None:
+    """Test that a recent discovery is reused instead of listening for beacons again."""
+    asyncio.run(store_cached_tcp_transports([_tcp_candidate("192.168.1.7")]))
+
+    result = runner.invoke(cli.app, ["discover", "tcp"])
+
+    assert result.exit_code == 0
+    assert "192.168.1.7" in result.output
+    enumerate_tcp.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        pytest.param(["--refresh"], id="refresh"),
+        pytest.param(["--interval", "1"], id="custom-interval"),
+    ],
+)
+def test_discover_tcp_bypasses_cache(
+    cache_home: Path, enumerate_tcp: AsyncMock, args: list[str]
+) -> None:
+    """Test that --refresh or a non-default interval always listens for beacons."""
+    asyncio.run(store_cached_tcp_transports([_tcp_candidate("192.168.1.7")]))
+    enumerate_tcp.return_value = [_tcp_candidate("192.168.1.8")]
+
+    result = runner.invoke(cli.app, ["discover", "tcp", *args])
+
+    assert result.exit_code == 0
+    assert "192.168.1.8" in result.output
+    assert "192.168.1.7" not in result.output
+    enumerate_tcp.assert_awaited_once()
+
+
+def test_discover_tcp_stores_results(cache_home: Path, enumerate_tcp: AsyncMock) -> None:
+    """Test that a fresh discovery is cached for the next default-interval lookup."""
+    enumerate_tcp.return_value = [_tcp_candidate("192.168.1.8")]
+
+    first = runner.invoke(cli.app, ["discover", "tcp"])
+    second = runner.invoke(cli.app, ["discover", "tcp"])
+
+    assert first.exit_code == second.exit_code == 0
+    assert "192.168.1.8" in second.output
+    enumerate_tcp.assert_awaited_once()
+
+
+def test_discover_tcp_ignores_unwritable_cache(cache_home: Path, enumerate_tcp: AsyncMock) -> None:
+    """Test that failing to read or write the cache does not fail the discovery."""
+    # A regular file where the cache directory should be makes both read and write raise OSError.
+    (cache_home / "seymourlib").write_text("")
+    enumerate_tcp.return_value = [_tcp_candidate("192.168.1.8")]
+
+    result = runner.invoke(cli.app, ["discover", "tcp"])
+
+    assert result.exit_code == 0
+    assert "192.168.1.8" in result.output
+    enumerate_tcp.assert_awaited_once()
+
+
+def test_discover_all_reports_both_scans(
+    enumerate_tcp: AsyncMock, enumerate_serial: AsyncMock
+) -> None:
+    """Test that discover all prints the results of both scans."""
+    enumerate_tcp.return_value = [_tcp_candidate("192.168.1.8")]
+    enumerate_serial.return_value = [_serial_candidate("/dev/ttyUSB0")]
+
+    result = runner.invoke(cli.app, ["discover", "all"])
+
+    assert result.exit_code == 0
+    assert "192.168.1.8" in result.output
+    assert "/dev/ttyUSB0" in result.output
+
+
+@pytest.mark.parametrize("failing", ["tcp", "serial"])
+def test_discover_all_reports_partial_failure(
+    enumerate_tcp: AsyncMock, enumerate_serial: AsyncMock, failing: str
+) -> None:
+    """Test that one scan failing still prints the other's results, then exits non-zero."""
+    enumerate_tcp.return_value = [_tcp_candidate("192.168.1.8")]
+    enumerate_serial.return_value = [_serial_candidate("/dev/ttyUSB0")]
+    failed, survivor = (
+        (enumerate_tcp, "/dev/ttyUSB0") if failing == "tcp" else (enumerate_serial, "192.168.1.8")
+    )
+    failed.side_effect = DiscoveryError(f"{failing} scan failed")
+
+    result = runner.invoke(cli.app, ["discover", "all"])
+
+    assert result.exit_code == 1
+    assert f"{failing} scan failed" in result.output
+    assert survivor in result.output
+
+
+@pytest.mark.parametrize("failing", ["tcp", "serial"])
+def test_discover_all_reraises_unexpected_errors(
+    enumerate_tcp: AsyncMock, enumerate_serial: AsyncMock, failing: str
+) -> None:
+    """Test that errors other than DiscoveryError are not reported as a failed scan."""
+    error = OSError("unexpected")
+    (enumerate_tcp if failing == "tcp" else enumerate_serial).side_effect = error
+
+    result = runner.invoke(cli.app, ["discover", "all"])
+
+    assert result.exception is error
+
+
+def test_discover_prints_tab_separated_lines_when_piped(
+    enumerate_tcp: AsyncMock, enumerate_serial: AsyncMock
+) -> None:
+    """Test the script-facing format used when stdout is not a terminal."""
+    enumerate_tcp.return_value = [_tcp_candidate("192.168.1.8")]
+    enumerate_serial.return_value = [
+        _serial_candidate("/dev/ttyUSB0"),
+        SerialTransportCandidate(
+            transport=SerialTransport("/dev/ttyS0", SEYMOUR_BAUD_RATE),
+            device="/dev/ttyS0",
+            baudrate=SEYMOUR_BAUD_RATE,
+            description="",
+            hardware_id="",
+        ),
+    ]
+
+    result = runner.invoke(cli.app, ["discover", "all"])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "192.168.1.8\t4999\tiTachIP2SL\tReady\tGC-192.168.1.8",
+        "/dev/ttyUSB0\t115200\tUSB Serial\tUSB VID:PID=0403:6001",
+        "/dev/ttyS0\t115200\t-\t-",
+    ]
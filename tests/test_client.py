@@ -3,9 +3,14 @@
 # mypy: disable-error-code="unreachable"
 
 import asyncio
+import inspect
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from tenacity import RetryError
 
 from seymourlib import protocol
 from seymourlib.client import (
@@ -21,17 +26,89 @@ from seymourlib.exceptions import (
 from seymourlib.transport import SeymourTransport
 
 
+class AsyncCallRecorder:
+    """Lightweight stand-in for AsyncMock covering the small API these tests use.
+
+    Records each call and honours ``side_effect`` (exception, iterable or callable) and
+    ``return_value`` the way AsyncMock does, without its per-call bookkeeping.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self.return_value: Any = None
+        self._side_effect: Any = None
+
+    @property
+    def side_effect(self) -> Any:
+        return self._side_effect
+
+    @side_effect.setter
+    def side_effect(self, value: Any) -> None:
+        # Like AsyncMock, consume a non-callable iterable one item per call
+        if isinstance(value, Iterable) and not callable(value):
+            value = iter(value)
+        self._side_effect = value
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        effect = self._side_effect
+        if effect is None:
+            return self.return_value
+        if isinstance(effect, Iterator):
+            effect = next(effect)
+            if _is_exception(effect):
+                raise effect
+            return effect
+        if _is_exception(effect):
+            raise effect
+        result = effect(*args, **kwargs)
+        return await result if inspect.isawaitable(result) else result
+
+    @property
+    def called(self) -> bool:
+        return bool(self.calls)
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    def assert_called(self) -> None:
+        assert self.calls, "Expected call, but not called"
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"Expected one call, got {len(self.calls)}"
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        self.assert_called_once()
+        assert self.calls[0] == (args, kwargs), f"Called with {self.calls[0]}"
+
+    def assert_not_called(self) -> None:
+        assert not self.calls, f"Expected no calls, got {len(self.calls)}"
+
+    def reset_mock(self, *, return_value: bool = False, side_effect: bool = False) -> None:
+        self.calls.clear()
+        if return_value:
+            self.return_value = None
+        if side_effect:
+            self._side_effect = None
+
+
+def _is_exception(value: Any) -> bool:
+    return isinstance(value, BaseException) or (
+        isinstance(value, type) and issubclass(value, BaseException)
+    )
+
+
 class MockTransport(SeymourTransport):
     """Mock transport for testing SeymourClient."""
 
     def __init__(self) -> None:
         super().__init__()
-        self.connect_mock = AsyncMock()
-        self.close_mock = AsyncMock()
-        self.send_mock = AsyncMock()
-        self.receive_mock = AsyncMock()
-        self.receive_responses: list[bytes] = []
-        self._receive_index = 0
+        self.connect_mock = AsyncCallRecorder()
+        self.close_mock = AsyncCallRecorder()
+        self.send_mock = AsyncCallRecorder()
+        self.receive_mock = AsyncCallRecorder()
+        self._responses: Iterator[bytes] = iter(())
 
     async def connect(self) -> None:
         await self.connect_mock()
@@ -43,39 +120,93 @@ class MockTransport(SeymourTransport):
         await self.send_mock(data)
 
     async def receive(self) -> bytes:
-        if self.receive_responses and self._receive_index < len(self.receive_responses):
-            response = self.receive_responses[self._receive_index]
-            self._receive_index += 1
+        response = next(self._responses, None)
+        if response is not None:
             return response
         result = await self.receive_mock()
         return result if isinstance(result, bytes) else b"default_response"
 
     def reset_mocks(self) -> None:
-        """Reset all mocks and response index."""
-        self.connect_mock.reset_mock()
-        self.close_mock.reset_mock()
-        self.send_mock.reset_mock()
-        self.receive_mock.reset_mock()
-        self._receive_index = 0
+        """Reset all mocks, including configured return values and side effects, and responses."""
+        for mock in (self.connect_mock, self.close_mock, self.send_mock, self.receive_mock):
+            mock.reset_mock(return_value=True, side_effect=True)
+        self._responses = iter(())
 
     def set_receive_responses(self, responses: list[bytes]) -> None:
-        """Set responses to return from receive calls."""
-        self.receive_responses = responses
-        self._receive_index = 0
+        """Set responses to return from receive calls, before falling back to receive_mock."""
+        self._responses = iter(responses)
 
 
-class TestSeymourClient:
-    """Test SeymourClient initialization and basic properties."""
+@pytest.fixture(scope="module")
+def transport() -> MockTransport:
+    """Create one mock transport for the module, reset between tests by reset_transport."""
+    return MockTransport()
 
-    @pytest.fixture
-    def transport(self) -> MockTransport:
-        """Create a mock transport for testing."""
-        return MockTransport()
 
-    @pytest.fixture
-    def client(self, transport: MockTransport) -> SeymourClient:
-        """Create a SeymourClient with mock transport."""
-        return SeymourClient(transport)
+@pytest.fixture(autouse=True)
+def reset_transport(transport: MockTransport) -> None:
+    """Hand every test the shared transport with no recorded calls or configured behaviour."""
+    transport.reset_mocks()
+
+
+@pytest.fixture
+async def client(transport: MockTransport) -> AsyncIterator[SeymourClient]:
+    """Create a SeymourClient with mock transport, closed again after the test."""
+    client = SeymourClient(transport)
+    yield client
+    # Tests share one event loop, so don't leave a health monitor running into the next one
+    await client.close()
+
+
+@pytest.fixture
+async def connected_client(client: SeymourClient) -> SeymourClient:
+    """The client fixture, already connected; request it where connecting isn't under test."""
+    await client.connect()
+    return client
+
+
+@pytest.fixture
+def advance_time(monkeypatch: pytest.MonkeyPatch) -> Callable[[float], Awaitable[None]]:
+    """Move the event loop's clock forward without sleeping, running whatever becomes due."""
+    offset = 0.0
+    monkeypatch.setattr(asyncio.BaseEventLoop, "time", lambda self: time.monotonic() + offset)
+
+    async def run_ready() -> None:
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    async def advance(seconds: float) -> None:
+        nonlocal offset
+        # Let newly started tasks schedule their timers before the clock moves, then let
+        # the timers that expire fire and their tasks run.
+        await run_ready()
+        offset += seconds
+        await run_ready()
+
+    return advance
+
+
+@pytest.fixture
+def fast_forward(
+    advance_time: Callable[[float], Awaitable[None]],
+) -> Callable[[Awaitable[Any]], Awaitable[Any]]:
+    """Await something that waits on loop timers (timeouts, retry back-off) in virtual time."""
+
+    async def run(awaitable: Awaitable[Any]) -> Any:
+        task = asyncio.ensure_future(awaitable)
+        for _ in range(200):
+            if task.done():
+                break
+            await advance_time(0.5)
+        else:
+            pytest.fail("Still waiting after 100 s of virtual time")
+        return await task
+
+    return run
+
+
+class TestSeymourClient:
+    """Test SeymourClient initialization and basic properties."""
 
     def test_initialization_defaults(self, transport: MockTransport) -> None:
         """Test client initialization with default parameters."""
@@ -95,36 +226,42 @@ class TestSeymourClient:
         assert client.request_timeout == 20.0
         assert not client.is_connected
 
-    def test_connection_stats_initial(self, client: SeymourClient) -> None:
-        """Test connection stats before any operations."""
-        stats = client.connection_stats
-        assert stats["last_successful_operation"] == 0.0
-        assert stats["time_since_last_success"] == -1
-
-    @patch("time.time")
-    def test_connection_stats_after_operation(self, mock_time: Mock, client: SeymourClient) -> None:
-        """Test connection stats after successful operation."""
-        mock_time.return_value = 1000.0
-        client._last_successful_operation = 950.0
+    @pytest.mark.parametrize(
+        ("last_success", "expected"),
+        [
+            pytest.param(
+                0.0,
+                {"last_successful_operation": 0.0, "time_since_last_success": -1},
+                id="initial",
+            ),
+            pytest.param(
+                950.0,
+                {
+                    "last_successful_operation": 1_700_000_000.0 - 50.0,
+                    "time_since_last_success": 50.0,
+                },
+                id="after_operation",
+            ),
+        ],
+    )
+    def test_connection_stats(
+        self,
+        client: SeymourClient,
+        monkeypatch: pytest.MonkeyPatch,
+        last_success: float,
+        expected: dict[str, float],
+    ) -> None:
+        """Test connection stats before and after a successful operation."""
+        monkeypatch.setattr("seymourlib.client.time.time", lambda: 1_700_000_000.0)
+        client._clock = lambda: 1000.0
+        client._last_successful_operation = last_success
 
-        stats = client.connection_stats
-        assert stats["last_successful_operation"] == 950.0
-        assert stats["time_since_last_success"] == 50.0
+        assert client.connection_stats == expected
 
 
 class TestSeymourClientConnection:
     """Test connection management functionality."""
 
-    @pytest.fixture
-    def transport(self) -> MockTransport:
-        """Create a mock transport for testing."""
-        return MockTransport()
-
-    @pytest.fixture
-    def client(self, transport: MockTransport) -> SeymourClient:
-        """Create a SeymourClient with mock transport."""
-        return SeymourClient(transport)
-
     @pytest.mark.asyncio
     async def test_connect_success(self, client: SeymourClient, transport: MockTransport) -> None:
         """Test successful connection."""
@@ -150,19 +287,25 @@ class TestSeymourClientConnection:
 
     @pytest.mark.asyncio
     async def test_connect_transport_error(
-        self, client: SeymourClient, transport: MockTransport
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        fast_forward: Callable[[Awaitable[Any]], Awaitable[Any]],
     ) -> None:
         """Test connection failure due to transport error."""
         transport.connect_mock.side_effect = SeymourTransportError("Connection failed")
 
         with pytest.raises(SeymourConnectionError, match="Failed to connect after all retries"):
-            await client.connect()
+            await fast_forward(client.connect())
 
         assert not client.is_connected
 
     @pytest.mark.asyncio
     async def test_connect_with_retries(
-        self, client: SeymourClient, transport: MockTransport
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        fast_forward: Callable[[Awaitable[Any]], Awaitable[Any]],
     ) -> None:
         """Test connection retries on failure."""
         # Fail twice, then succeed
@@ -172,15 +315,15 @@ class TestSeymourClientConnection:
             None,  # Success
         ]
 
-        await client.connect()
+        await fast_forward(client.connect())
 
         assert client.is_connected
         assert transport.connect_mock.call_count == 3
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_close_success(self, client: SeymourClient, transport: MockTransport) -> None:
         """Test successful close."""
-        await client.connect()
         assert client.is_connected
 
         await client.close()
@@ -201,11 +344,11 @@ class TestSeymourClientConnection:
         transport.close_mock.assert_not_called()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_close_with_health_monitoring(
         self, client: SeymourClient, transport: MockTransport
     ) -> None:
         """Test close cancels health monitoring task."""
-        await client.connect()
         await client.start_health_monitoring(interval=0.1)
 
         # Ensure health check task is running
@@ -225,16 +368,6 @@ class TestSeymourClientConnection:
 class TestSeymourClientContextManager:
     """Test async context manager functionality."""
 
-    @pytest.fixture
-    def transport(self) -> MockTransport:
-        """Create a mock transport for testing."""
-        return MockTransport()
-
-    @pytest.fixture
-    def client(self, transport: MockTransport) -> SeymourClient:
-        """Create a SeymourClient with mock transport."""
-        return SeymourClient(transport)
-
     @pytest.mark.asyncio
     async def test_context_manager_success(
         self, client: SeymourClient, transport: MockTransport
@@ -265,21 +398,10 @@ class TestSeymourClientContextManager:
 class TestSeymourClientHealthMonitoring:
     """Test health monitoring functionality."""
 
-    @pytest.fixture
-    def transport(self) -> MockTransport:
-        """Create a mock transport for testing."""
-        return MockTransport()
-
-    @pytest.fixture
-    def client(self, transport: MockTransport) -> SeymourClient:
-        """Create a SeymourClient with mock transport."""
-        return SeymourClient(transport)
-
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_start_health_monitoring(self, client: SeymourClient) -> None:
         """Test starting health monitoring."""
-        await client.connect()
-
         await client.start_health_monitoring(interval=0.1)
 
         assert client._health_check_task is not None
@@ -288,9 +410,9 @@ class TestSeymourClientHealthMonitoring:
         await client.close()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_start_health_monitoring_already_running(self, client: SeymourClient) -> None:
         """Test starting health monitoring when already running."""
-        await client.connect()
         await client.start_health_monitoring(interval=0.1)
 
         task1 = client._health_check_task
@@ -303,12 +425,14 @@ class TestSeymourClientHealthMonitoring:
         await client.close()
 
     @pytest.mark.asyncio
-    @patch("seymourlib.client.time.time")
     async def test_health_check_skip_recent_operation(
-        self, mock_time: Mock, client: SeymourClient, transport: MockTransport
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        advance_time: Callable[[float], Awaitable[None]],
     ) -> None:
         """Test health check skipped when recent successful operation."""
-        mock_time.return_value = 1000.0
+        client._clock = lambda: 1000.0
         client._last_successful_operation = 999.9  # Very recent
 
         # Mock get_status to track if it's called
@@ -316,8 +440,9 @@ class TestSeymourClientHealthMonitoring:
             await client.connect()
             await client.start_health_monitoring(interval=0.05)  # 50ms interval
 
-            # Wait a bit longer than the interval
-            await asyncio.sleep(0.1)
+            # Run two health check intervals
+            await advance_time(0.05)
+            await advance_time(0.05)
 
             # get_status should not be called because operation was recent
             mock_get_status.assert_not_called()
@@ -326,21 +451,52 @@ class TestSeymourClientHealthMonitoring:
 
     @pytest.mark.asyncio
     async def test_health_check_failure_marks_disconnected(
-        self, client: SeymourClient, transport: MockTransport
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        advance_time: Callable[[float], Awaitable[None]],
     ) -> None:
         """Test health check failure marks client as disconnected."""
-        # Mock get_status to fail
-        with patch.object(client, "get_status", new_callable=AsyncMock) as mock_get_status:
-            mock_get_status.side_effect = SeymourTransportError("Health check failed")
+        probed = asyncio.Event()
 
-            await client.connect()
-            await client.start_health_monitoring(interval=0.05)
+        async def bad_status_reply() -> bytes:
+            probed.set()
+            return b"[not a status]"
 
-            # Wait for health check to run
-            await asyncio.sleep(0.1)
+        transport.receive_mock.side_effect = bad_status_reply
+        # Measure "recent success" on the same virtual clock the health monitor sleeps on
+        client._clock = asyncio.get_running_loop().time
+        await client.connect()
+        # Keep the background reconnect from immediately undoing the failure
+        transport.connect_mock.side_effect = OSError("Device unreachable")
+        await client.start_health_monitoring(interval=0.05)
 
-            # Client should be marked as disconnected
-            assert not client.is_connected
+        # Run one health check interval
+        await advance_time(0.05)
+
+        # The probe ran, and its failure marked the client disconnected
+        assert probed.is_set()
+        assert not client.is_connected
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
+    async def test_health_monitor_reconnects_in_background(
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        advance_time: Callable[[float], Awaitable[None]],
+    ) -> None:
+        """Test that the health monitor re-establishes a dropped connection."""
+        client._connected = False  # Simulate a failed request
+        transport.reset_mocks()
+
+        await client.start_health_monitoring(interval=0.05)
+        await advance_time(0.05)
+
+        assert client.is_connected
+        transport.connect_mock.assert_called_once()
 
         await client.close()
 
@@ -349,23 +505,20 @@ class TestSeymourClientOperations:
     """Test transport operations and protocol methods."""
 
     @pytest.fixture
-    def transport(self) -> MockTransport:
-        """Create a mock transport for testing."""
-        return MockTransport()
-
-    @pytest.fixture
-    def client(self, transport: MockTransport) -> SeymourClient:
-        """Create a SeymourClient with mock transport."""
-        return SeymourClient(transport, max_retries=2, request_timeout=1.0)
+    async def client(self, transport: MockTransport) -> AsyncIterator[SeymourClient]:
+        """Create a SeymourClient with mock transport, closed again after the test."""
+        client = SeymourClient(transport, max_retries=2, request_timeout=1.0)
+        yield client
+        await client.close()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_execute_operation_success(
         self, client: SeymourClient, transport: MockTransport
     ) -> None:
         """Test successful operation execution."""
         transport.receive_mock.return_value = b"[test_response]"
 
-        await client.connect()
         result = await client._execute_operation(b"[test_frame]", receive=True)
 
         assert result == b"[test_response]"
@@ -373,11 +526,11 @@ class TestSeymourClientOperations:
         transport.receive_mock.assert_called_once()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_execute_operation_send_only(
         self, client: SeymourClient, transport: MockTransport
     ) -> None:
         """Test operation execution without receiving response."""
-        await client.connect()
         result = await client._execute_operation(b"[test_frame]", receive=False)
 
         assert result is None
@@ -400,8 +553,12 @@ class TestSeymourClientOperations:
         transport.connect_mock.assert_called()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_execute_operation_with_retries(
-        self, client: SeymourClient, transport: MockTransport
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        fast_forward: Callable[[Awaitable[Any]], Awaitable[Any]],
     ) -> None:
         """Test operation retries on transport errors."""
         # Fail once, then succeed
@@ -411,44 +568,49 @@ class TestSeymourClientOperations:
         ]
         transport.receive_mock.return_value = b"[response]"
 
-        await client.connect()
-        result = await client._execute_operation(b"[frame]", receive=True)
+        result = await fast_forward(client._execute_operation(b"[frame]", receive=True))
 
         assert result == b"[response]"
         assert transport.send_mock.call_count == 2
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_execute_operation_timeout(
-        self, client: SeymourClient, transport: MockTransport
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        fast_forward: Callable[[Awaitable[Any]], Awaitable[Any]],
     ) -> None:
         """Test operation timeout handling."""
 
-        async def slow_send(data: bytes) -> None:
-            await asyncio.sleep(2.0)  # Longer than request_timeout
+        async def hanging_send(data: bytes) -> None:
+            await asyncio.get_running_loop().create_future()  # Never completes
 
-        transport.send_mock.side_effect = slow_send
-        await client.connect()
+        transport.send_mock.side_effect = hanging_send
 
         # Should raise RetryError due to tenacity wrapping the TimeoutError
-        from tenacity import RetryError
-
         with pytest.raises(RetryError):
-            await client._execute_operation(b"[frame]", receive=False)
+            await fast_forward(client._execute_operation(b"[frame]", receive=False))
+        assert transport.send_mock.call_count == 2
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_send_and_maybe_receive_marks_disconnected_on_error(
-        self, client: SeymourClient, transport: MockTransport
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        fast_forward: Callable[[Awaitable[Any]], Awaitable[Any]],
     ) -> None:
         """Test that transport errors mark client as disconnected."""
         transport.send_mock.side_effect = SeymourTransportError("Transport failed")
-        await client.connect()
 
         with pytest.raises(SeymourConnectionError):
-            await client._send_and_maybe_receive(b"[frame]")
+            await fast_forward(client._send_and_maybe_receive(b"[frame]"))
 
         assert not client.is_connected
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_send_and_maybe_receive_protocol_error(
         self, client: SeymourClient, transport: MockTransport
     ) -> None:
@@ -459,7 +621,6 @@ class TestSeymourClientOperations:
         subsequent operations can succeed without a needless reconnect.
         """
         transport.send_mock.side_effect = ValueError("Protocol error")
-        await client.connect()
 
         with pytest.raises(SeymourProtocolError):
             await client._send_and_maybe_receive(b"[frame]")
@@ -468,69 +629,86 @@ class TestSeymourClientOperations:
         assert client.is_connected
 
 
-class TestSeymourClientPublicAPI:
-    """Test public API methods."""
+# Frames returned by the mocked encoders in TestSeymourClientPublicAPI
+_ENCODED_FRAMES = {
+    "encode_status": b"[S]",
+    "encode_positions": b"[P]",
+    "encode_read_sysinfo": b"[Y]",
+    "encode_read_settings": b"[R]",
+    "encode_diagnostics": b"[@A]",
+    "encode_move_out": b"[OT]",
+    "encode_move_in": b"[IB]",
+    "encode_move_ratio": b"[M123]",
+    "encode_home": b"[AL]",
+    "encode_halt": b"[HR]",
+    "encode_calibrate": b"[CV]",
+    "encode_update_ratio": b"[U456]",
+    "encode_clear_settings": b"[X789]",
+}
 
-    @pytest.fixture
-    def transport(self) -> MockTransport:
-        """Create a mock transport for testing."""
-        return MockTransport()
 
-    @pytest.fixture
-    def client(self, transport: MockTransport) -> SeymourClient:
-        """Create a SeymourClient with mock transport."""
-        return SeymourClient(transport)
+class TestSeymourClientPublicAPI:
+    """Test public API methods."""
 
-    @pytest.mark.asyncio
-    async def test_get_status(self, client: SeymourClient, transport: MockTransport) -> None:
+    @pytest.fixture(scope="class", autouse=True)
+    def encoders(self) -> Iterator[dict[str, Mock]]:
+        """Swap the protocol encoders for mocks once for the class; each returns a fixed frame."""
+        mocks = {name: Mock(return_value=frame) for name, frame in _ENCODED_FRAMES.items()}
+        with pytest.MonkeyPatch.context() as mp:
+            for name, mock in mocks.items():
+                mp.setattr(protocol, name, mock)
+            yield mocks
+
+    @pytest.fixture(autouse=True)
+    def reset_encoders(self, encoders: dict[str, Mock]) -> None:
+        """Clear calls recorded on the shared encoder mocks by earlier tests."""
+        for mock in encoders.values():
+            mock.reset_mock()
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
+    async def test_get_status(
+        self, client: SeymourClient, transport: MockTransport, encoders: dict[str, Mock]
+    ) -> None:
         """Test get_status method."""
-        # Mock protocol encoding/decoding
-        with (
-            patch("seymourlib.protocol.encode_status") as mock_encode,
-            patch("seymourlib.protocol.decode_status") as mock_decode,
-        ):
-            mock_encode.return_value = b"[S]"
+        with patch("seymourlib.protocol.decode_status") as mock_decode:
             mock_decode.return_value = protocol.MaskStatus(
                 code=protocol.StatusCode.STOPPED_AT_RATIO, ratio=protocol.Ratio("123")
             )
             transport.receive_mock.return_value = b"[S123]"
 
-            await client.connect()
             result = await client.get_status()
 
             assert isinstance(result, protocol.MaskStatus)
-            mock_encode.assert_called_once()
+            encoders["encode_status"].assert_called_once_with()
             mock_decode.assert_called_once_with(b"[S123]")
 
     @pytest.mark.asyncio
-    async def test_get_positions(self, client: SeymourClient, transport: MockTransport) -> None:
+    @pytest.mark.usefixtures("connected_client")
+    async def test_get_positions(
+        self, client: SeymourClient, transport: MockTransport, encoders: dict[str, Mock]
+    ) -> None:
         """Test get_positions method."""
-        with (
-            patch("seymourlib.protocol.encode_positions") as mock_encode,
-            patch("seymourlib.protocol.decode_positions") as mock_decode,
-        ):
-            mock_encode.return_value = b"[P]"
+        with patch("seymourlib.protocol.decode_positions") as mock_decode:
             mock_decode.return_value = [
                 protocol.MaskPosition(motor_id=protocol.MotorID.TOP, position_pct=50.0)
             ]
             transport.receive_mock.return_value = b"[PT50.0]"
 
-            await client.connect()
             result = await client.get_positions()
 
             assert isinstance(result, list)
             assert len(result) == 1
-            mock_encode.assert_called_once()
+            encoders["encode_positions"].assert_called_once_with()
             mock_decode.assert_called_once_with(b"[PT50.0]")
 
     @pytest.mark.asyncio
-    async def test_get_system_info(self, client: SeymourClient, transport: MockTransport) -> None:
+    @pytest.mark.usefixtures("connected_client")
+    async def test_get_system_info(
+        self, client: SeymourClient, transport: MockTransport, encoders: dict[str, Mock]
+    ) -> None:
         """Test get_system_info method."""
-        with (
-            patch("seymourlib.protocol.encode_read_sysinfo") as mock_encode,
-            patch("seymourlib.protocol.decode_system_info") as mock_decode,
-        ):
-            mock_encode.return_value = b"[Y]"
+        with patch("seymourlib.protocol.decode_system_info") as mock_decode:
             mock_info = protocol.SystemInfo(
                 screen_model="TEST",
                 width_inches=100.0,
@@ -541,23 +719,19 @@ class TestSeymourClientPublicAPI:
             mock_decode.return_value = mock_info
             transport.receive_mock.return_value = b"[Y...]"
 
-            await client.connect()
             result = await client.get_system_info()
 
             assert result is mock_info
-            mock_encode.assert_called_once()
+            encoders["encode_read_sysinfo"].assert_called_once_with()
             mock_decode.assert_called_once_with(b"[Y...]")
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_get_ratio_settings(
-        self, client: SeymourClient, transport: MockTransport
+        self, client: SeymourClient, transport: MockTransport, encoders: dict[str, Mock]
     ) -> None:
         """Test get_ratio_settings method."""
-        with (
-            patch("seymourlib.protocol.encode_read_settings") as mock_encode,
-            patch("seymourlib.protocol.decode_settings") as mock_decode,
-        ):
-            mock_encode.return_value = b"[R]"
+        with patch("seymourlib.protocol.decode_settings") as mock_decode:
             mock_decode.return_value = [
                 protocol.RatioSetting(
                     ratio=protocol.Ratio("123"),
@@ -570,157 +744,106 @@ class TestSeymourClientPublicAPI:
             ]
             transport.receive_mock.return_value = b"[R...]"
 
-            await client.connect()
             result = await client.get_ratio_settings()
 
             assert isinstance(result, list)
             assert len(result) == 1
-            mock_encode.assert_called_once()
+            encoders["encode_read_settings"].assert_called_once_with()
             mock_decode.assert_called_once_with(b"[R...]")
 
     @pytest.mark.asyncio
-    async def test_get_diagnostics(self, client: SeymourClient, transport: MockTransport) -> None:
-        """Test get_diagnostics method."""
-        with patch("seymourlib.protocol.encode_diagnostics") as mock_encode:
-            mock_encode.return_value = b"[@A]"
-            transport.receive_mock.return_value = b"Diagnostic info"
-
-            await client.connect()
-            result = await client.get_diagnostics(protocol.DiagnosticOption.LIST_FS)
-
-            assert result == "Diagnostic info"
-            mock_encode.assert_called_once_with(protocol.DiagnosticOption.LIST_FS)
-
-    @pytest.mark.asyncio
-    async def test_move_out(self, client: SeymourClient, transport: MockTransport) -> None:
-        """Test move_out method."""
-        with patch("seymourlib.protocol.encode_move_out") as mock_encode:
-            mock_encode.return_value = b"[OT]"
-
-            await client.connect()
-            await client.move_out(protocol.MotorID.TOP, protocol.MovementCode.JOG)
-
-            mock_encode.assert_called_once_with(protocol.MotorID.TOP, protocol.MovementCode.JOG)
-            transport.send_mock.assert_called_once_with(b"[OT]")
-
-    @pytest.mark.asyncio
-    async def test_move_in(self, client: SeymourClient, transport: MockTransport) -> None:
-        """Test move_in method."""
-        with patch("seymourlib.protocol.encode_move_in") as mock_encode:
-            mock_encode.return_value = b"[IB]"
-
-            await client.connect()
-            await client.move_in(protocol.MotorID.BOTTOM, protocol.MovementCode.MOVE)
-
-            mock_encode.assert_called_once_with(protocol.MotorID.BOTTOM, protocol.MovementCode.MOVE)
-            transport.send_mock.assert_called_once_with(b"[IB]")
-
-    @pytest.mark.asyncio
-    async def test_move_to_ratio(self, client: SeymourClient, transport: MockTransport) -> None:
-        """Test move_to_ratio method."""
-        with patch("seymourlib.protocol.encode_move_ratio") as mock_encode:
-            mock_encode.return_value = b"[M123]"
-            ratio = protocol.Ratio("123")
-
-            await client.connect()
-            await client.move_to_ratio(ratio)
-
-            mock_encode.assert_called_once_with(ratio)
-            transport.send_mock.assert_called_once_with(b"[M123]")
-
-    @pytest.mark.asyncio
-    async def test_home(self, client: SeymourClient, transport: MockTransport) -> None:
-        """Test home method."""
-        with patch("seymourlib.protocol.encode_home") as mock_encode:
-            mock_encode.return_value = b"[AL]"
-
-            await client.connect()
-            await client.home(protocol.MotorID.LEFT)
-
-            mock_encode.assert_called_once_with(protocol.MotorID.LEFT)
-            transport.send_mock.assert_called_once_with(b"[AL]")
-
-    @pytest.mark.asyncio
-    async def test_halt(self, client: SeymourClient, transport: MockTransport) -> None:
-        """Test halt method."""
-        with patch("seymourlib.protocol.encode_halt") as mock_encode:
-            mock_encode.return_value = b"[HR]"
-
-            await client.connect()
-            await client.halt(protocol.MotorID.RIGHT)
-
-            mock_encode.assert_called_once_with(protocol.MotorID.RIGHT)
-            transport.send_mock.assert_called_once_with(b"[HR]")
-
-    @pytest.mark.asyncio
-    async def test_calibrate(self, client: SeymourClient, transport: MockTransport) -> None:
-        """Test calibrate method."""
-        with patch("seymourlib.protocol.encode_calibrate") as mock_encode:
-            mock_encode.return_value = b"[CV]"
-
-            await client.connect()
-            await client.calibrate(protocol.MotorID.VERTICAL)
-
-            mock_encode.assert_called_once_with(protocol.MotorID.VERTICAL)
-            transport.send_mock.assert_called_once_with(b"[CV]")
-
-    @pytest.mark.asyncio
-    async def test_update_ratio(self, client: SeymourClient, transport: MockTransport) -> None:
-        """Test update_ratio method."""
-        with patch("seymourlib.protocol.encode_update_ratio") as mock_encode:
-            mock_encode.return_value = b"[U456]"
-            ratio = protocol.Ratio("456")
-
-            await client.connect()
-            await client.update_ratio(ratio)
-
-            mock_encode.assert_called_once_with(ratio)
-            transport.send_mock.assert_called_once_with(b"[U456]")
-
-    @pytest.mark.asyncio
-    async def test_reset_factory_default_with_ratio(
-        self, client: SeymourClient, transport: MockTransport
+    @pytest.mark.usefixtures("connected_client")
+    async def test_get_diagnostics(
+        self, client: SeymourClient, transport: MockTransport, encoders: dict[str, Mock]
     ) -> None:
-        """Test reset_factory_default method with ratio."""
-        with patch("seymourlib.protocol.encode_clear_settings") as mock_encode:
-            mock_encode.return_value = b"[X789]"
-            ratio = protocol.Ratio("789")
-
-            await client.connect()
-            await client.reset_factory_default(ratio)
-
-            mock_encode.assert_called_once_with(ratio)
-            transport.send_mock.assert_called_once_with(b"[X789]")
-
-    @pytest.mark.asyncio
-    async def test_reset_factory_default_no_ratio(
-        self, client: SeymourClient, transport: MockTransport
+        """Test get_diagnostics method."""
+        transport.receive_mock.return_value = b"Diagnostic info"
+
+        result = await client.get_diagnostics(protocol.DiagnosticOption.LIST_FS)
+
+        assert result == "Diagnostic info"
+        encoders["encode_diagnostics"].assert_called_once_with(protocol.DiagnosticOption.LIST_FS)
+        transport.send_mock.assert_called_once_with(b"[@A]")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("encode_name", "method_name", "args"),
+        [
+            pytest.param(
+                "encode_move_out",
+                "move_out",
+                (protocol.MotorID.TOP, protocol.MovementCode.JOG),
+                id="move_out",
+            ),
+            pytest.param(
+                "encode_move_in",
+                "move_in",
+                (protocol.MotorID.BOTTOM, protocol.MovementCode.MOVE),
+                id="move_in",
+            ),
+            pytest.param(
+                "encode_move_ratio",
+                "move_to_ratio",
+                (protocol.Ratio("123"),),
+                id="move_to_ratio",
+            ),
+            pytest.param("encode_home", "home", (protocol.MotorID.LEFT,), id="home"),
+            pytest.param("encode_halt", "halt", (protocol.MotorID.RIGHT,), id="halt"),
+            pytest.param(
+                "encode_calibrate",
+                "calibrate",
+                (protocol.MotorID.VERTICAL,),
+                id="calibrate",
+            ),
+            pytest.param(
+                "encode_update_ratio",
+                "update_ratio",
+                (protocol.Ratio("456"),),
+                id="update_ratio",
+            ),
+            pytest.param(
+                "encode_clear_settings",
+                "reset_factory_default",
+                (protocol.Ratio("789"),),
+                id="reset_factory_default_with_ratio",
+            ),
+            pytest.param(
+                "encode_clear_settings",
+                "reset_factory_default",
+                (None,),
+                id="reset_factory_default_no_ratio",
+            ),
+        ],
+    )
+    @pytest.mark.usefixtures("connected_client")
+    async def test_command(
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        encoders: dict[str, Mock],
+        encode_name: str,
+        method_name: str,
+        args: tuple[Any, ...],
     ) -> None:
-        """Test reset_factory_default method without ratio."""
-        with patch("seymourlib.protocol.encode_clear_settings") as mock_encode:
-            mock_encode.return_value = b"[X]"
+        """Test that each command method encodes its arguments and sends the frame."""
+        await getattr(client, method_name)(*args)
 
-            await client.connect()
-            await client.reset_factory_default(None)
-
-            mock_encode.assert_called_once_with(None)
-            transport.send_mock.assert_called_once_with(b"[X]")
+        encoders[encode_name].assert_called_once_with(*args)
+        transport.send_mock.assert_called_once_with(_ENCODED_FRAMES[encode_name])
 
 
 class TestSeymourClientHealthCheckIntegration:
     """Integration tests for health check functionality."""
 
     @pytest.fixture
-    def transport(self) -> MockTransport:
-        """Create a mock transport for testing."""
-        return MockTransport()
-
-    @pytest.fixture
-    def client(self, transport: MockTransport) -> SeymourClient:
-        """Create a SeymourClient with mock transport."""
-        return SeymourClient(transport, request_timeout=1.0)
+    async def client(self, transport: MockTransport) -> AsyncIterator[SeymourClient]:
+        """Create a SeymourClient with mock transport, closed again after the test."""
+        client = SeymourClient(transport, request_timeout=1.0)
+        yield client
+        await client.close()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_health_check_timeout_modification(
         self, client: SeymourClient, transport: MockTransport
     ) -> None:
@@ -731,25 +854,26 @@ class TestSeymourClientHealthCheckIntegration:
         # Return a valid status frame so decode_status succeeds
         transport.receive_mock.return_value = b"[01P]"  # valid stopped status
 
-        await client.connect()
         await client._health_check()
 
         # request_timeout must NOT have been mutated
         assert client.request_timeout == original_timeout
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_health_check_timeout_restoration_on_exception(
-        self, client: SeymourClient, transport: MockTransport
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        fast_forward: Callable[[Awaitable[Any]], Awaitable[Any]],
     ) -> None:
         """Test timeout is not mutated even if health check fails."""
         original_timeout = client.request_timeout
 
         transport.send_mock.side_effect = SeymourTransportError("Health check failed")
 
-        await client.connect()
-
         with pytest.raises(SeymourConnectionError):
-            await client._health_check()
+            await fast_forward(client._health_check())
 
         # Timeout must still be the original value
         assert client.request_timeout == original_timeout
@@ -759,36 +883,31 @@ class TestSeymourClientEdgeCases:
     """Test edge cases and error conditions."""
 
     @pytest.fixture
-    def transport(self) -> MockTransport:
-        """Create a mock transport for testing."""
-        return MockTransport()
-
-    @pytest.fixture
-    def client(self, transport: MockTransport) -> SeymourClient:
-        """Create a SeymourClient with mock transport."""
-        return SeymourClient(transport, max_retries=1)
+    async def client(self, transport: MockTransport) -> AsyncIterator[SeymourClient]:
+        """Create a SeymourClient with mock transport, closed again after the test."""
+        client = SeymourClient(transport, max_retries=1)
+        yield client
+        await client.close()
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_operation_failure_after_max_retries(
         self, client: SeymourClient, transport: MockTransport
     ) -> None:
         """Test operation failure after exhausting retries."""
         transport.send_mock.side_effect = SeymourTransportError("Persistent failure")
-        await client.connect()
 
         # Should raise RetryError when all retries are exhausted
-        from tenacity import RetryError
-
         with pytest.raises(RetryError):
             await client._execute_operation(b"[frame]")
 
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("connected_client")
     async def test_concurrent_operations(
         self, client: SeymourClient, transport: MockTransport
     ) -> None:
         """Test concurrent operations don't interfere with each other."""
         transport.receive_mock.side_effect = [b"[response1]", b"[response2]"]
-        await client.connect()
 
         # Start two operations concurrently
         task1 = asyncio.create_task(client._execute_operation(b"[frame1]"))
@@ -802,22 +921,26 @@ class TestSeymourClientEdgeCases:
 
     @pytest.mark.asyncio
     async def test_health_monitoring_with_exceptions(
-        self, client: SeymourClient, transport: MockTransport
+        self,
+        client: SeymourClient,
+        transport: MockTransport,
+        advance_time: Callable[[float], Awaitable[None]],
     ) -> None:
         """Test health monitoring continues after transport exceptions."""
         call_count = 0
-        original_send = transport.send_mock
+        recovered = asyncio.Event()
 
         async def failing_send(data: bytes) -> None:
             nonlocal call_count
             call_count += 1
             if call_count <= 2:
                 raise SeymourTransportError(f"Transient failure {call_count}")
-            await original_send(data)
+            recovered.set()
 
         # Return a valid status frame for successful health checks
         transport.receive_mock.return_value = b"[01P]"
 
+        client._clock = asyncio.get_running_loop().time
         await client.connect()
         client._last_successful_operation = 0.0  # Force health checks
 
@@ -825,22 +948,25 @@ class TestSeymourClientEdgeCases:
 
         await client.start_health_monitoring(interval=0.05)
 
-        # Wait for multiple health check cycles
-        await asyncio.sleep(0.5)
+        # Run health check cycles until a probe gets through
+        for _ in range(20):
+            await advance_time(0.05)
+            if recovered.is_set():
+                break
 
         # Health monitoring should still be running despite exceptions
+        assert recovered.is_set()
         assert client._health_check_task is not None and not client._health_check_task.done()
-        assert call_count >= 1
+        assert client.is_connected
 
         await client.close()
 
     @pytest.mark.asyncio
-    @patch("time.time")
     async def test_last_successful_operation_tracking(
-        self, mock_time: Mock, client: SeymourClient, transport: MockTransport
+        self, client: SeymourClient, transport: MockTransport
     ) -> None:
         """Test that successful operations update last_successful_operation timestamp."""
-        mock_time.return_value = 12345.0
+        client._clock = lambda: 12345.0
         transport.receive_mock.return_value = b"[response]"
 
         await client.connect()
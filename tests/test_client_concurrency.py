@@ -29,12 +29,20 @@ These tests exercise the fix from several angles:
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+import pytest
+import pytest_asyncio
 
 from seymourlib import protocol
 from seymourlib.client import SeymourClient
 from seymourlib.exceptions import SeymourProtocolError
 from seymourlib.transport import SeymourTransport
 
+# These tests are all task scheduling, so give the module its own loop, on uvloop when it is
+# installed; the rest of the suite keeps the stock asyncio loop.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -42,9 +50,14 @@ from seymourlib.transport import SeymourTransport
 # Realistic canned frames the "device" would return for each command.
 STATUS_REQ = protocol.encode_status()  # [01S]
 STATUS_RESP = b"[01P178]"  # stopped at ratio 178
+STATUS = protocol.MaskStatus(code=protocol.StatusCode.STOPPED_AT_RATIO, ratio=protocol.Ratio("178"))
 
 POSITIONS_REQ = protocol.encode_positions()  # [01P]
 POSITIONS_RESP = b"[012T50.0B25.0]"  # 2 motors
+POSITIONS = [
+    protocol.MaskPosition(motor_id=protocol.MotorID.TOP, position_pct=50.0),
+    protocol.MaskPosition(motor_id=protocol.MotorID.BOTTOM, position_pct=25.0),
+]
 
 MOVE_OUT_REQ = protocol.encode_move_out(  # fire-and-forget
     protocol.MotorID.TOP, protocol.MovementCode.JOG
@@ -55,23 +68,18 @@ class OrderTrackingTransport(SeymourTransport):
     """Mock transport that records operation ordering and returns the correct
     response for each request frame.
 
-    A small ``asyncio.sleep`` in both ``send`` and ``receive`` widens the
-    window in which interleaving *would* occur without the client-level lock.
+    Both ``send`` and ``receive`` yield to the event loop, which is all it takes
+    for another task to interleave *would* the client-level lock not prevent it.
+    A zero-length sleep does that without arming a timer, so the suite stays fast.
 
     The response for each ``send`` is remembered so that the immediately
     following ``receive`` returns the matching frame — exactly how a real
     half-duplex serial device behaves under the client lock.
     """
 
-    def __init__(
-        self,
-        response_map: dict[bytes, bytes],
-        *,
-        op_delay: float = 0.005,
-    ) -> None:
+    def __init__(self, response_map: dict[bytes, bytes]) -> None:
         super().__init__()
         self._response_map = response_map
-        self._op_delay = op_delay
 
         # Each entry is ("send", frame) or ("recv", frame).
         self.log: list[tuple[str, bytes]] = []
@@ -87,10 +95,10 @@ class OrderTrackingTransport(SeymourTransport):
         # Because the client lock guarantees at most one send/receive pair
         # in-flight, a simple instance variable is safe here.
         self._last_response = self._response_map.get(data, b"[01P]")
-        await asyncio.sleep(self._op_delay)
+        await asyncio.sleep(0)
 
     async def receive(self) -> bytes:
-        await asyncio.sleep(self._op_delay)
+        await asyncio.sleep(0)
         resp = self._last_response
         self.log.append(("recv", resp))
         return resp
@@ -101,13 +109,12 @@ class PipedTransport(SeymourTransport):
     ``receive()`` calls truly race on the same byte stream — exactly the
     scenario that caused torn reads before the client-level lock was added.
 
-    The "device" side is driven by :meth:`device_write`, which pushes raw
-    bytes into the pipe.
+    ``send`` plays the device, pushing the mapped response into the pipe;
+    ``receive`` is SeymourTransport's own, so the real frame splitter is exercised.
     """
 
     def __init__(self) -> None:
         super().__init__()
-        self._device_writer: asyncio.StreamWriter | None = None
         self._frames_sent: list[bytes] = []
         self._response_map: dict[bytes, bytes] = {}
 
@@ -120,14 +127,43 @@ class PipedTransport(SeymourTransport):
         self._frames_sent.append(data)
         # Simulate the device echoing back the mapped response.
         resp = self._response_map.get(data, b"[01P]")
-        await asyncio.sleep(0.002)  # simulate wire delay
+        await asyncio.sleep(0)  # let other tasks run, as a wire delay would
         assert self.reader is not None
         self.reader.feed_data(resp)
 
-    async def receive(self) -> bytes:
-        assert self.reader is not None
-        data = await self.reader.readuntil(b"]")
-        return data
+    # receive() is inherited: the production frame splitter reads from the pipe.
+
+
+ConnectClient = Callable[..., Awaitable[SeymourClient]]
+
+
+@pytest.fixture(scope="module")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run this module's loop under uvloop when it is available."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    policy: asyncio.AbstractEventLoopPolicy = uvloop.EventLoopPolicy()
+    return policy
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def connect_client() -> AsyncIterator[ConnectClient]:
+    """Build and connect a client around a test transport; every one is closed at teardown."""
+    clients: list[SeymourClient] = []
+
+    async def connect(
+        transport: SeymourTransport, *, request_timeout: float = 5.0
+    ) -> SeymourClient:
+        client = SeymourClient(transport, max_retries=1, request_timeout=request_timeout)
+        clients.append(client)
+        await client.connect()
+        return client
+
+    yield connect
+    for client in clients:
+        await client.close()
 
 
 # ---------------------------------------------------------------------------
@@ -140,15 +176,14 @@ class TestConcurrentOperationOrdering:
     client-level lock.
     """
 
-    async def test_pairs_never_interleave(self) -> None:
+    async def test_pairs_never_interleave(self, connect_client: ConnectClient) -> None:
         """With N concurrent request–response operations, the operation log
         must always show alternating (send, recv) pairs — never two
         consecutive sends followed by two receives.
         """
         response_map = {STATUS_REQ: STATUS_RESP, POSITIONS_REQ: POSITIONS_RESP}
         transport = OrderTrackingTransport(response_map)
-        client = SeymourClient(transport, max_retries=1, request_timeout=5.0)
-        await client.connect()
+        client = await connect_client(transport)
 
         async def do_status() -> None:
             await client.get_status()
@@ -156,60 +191,47 @@ class TestConcurrentOperationOrdering:
         async def do_positions() -> None:
             await client.get_positions()
 
-        tasks = [
-            asyncio.create_task(do_status()),
-            asyncio.create_task(do_positions()),
-            asyncio.create_task(do_status()),
-            asyncio.create_task(do_positions()),
-        ]
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(do_status())
+            tg.create_task(do_positions())
+            tg.create_task(do_status())
+            tg.create_task(do_positions())
 
         # The log must consist of (send, recv) pairs without interleaving.
-        assert len(transport.log) == 8  # 4 sends + 4 receives
-        for i in range(0, len(transport.log), 2):
-            assert transport.log[i][0] == "send", (
-                f"Entry {i} should be 'send', got {transport.log[i]}"
-            )
-            assert transport.log[i + 1][0] == "recv", (
-                f"Entry {i + 1} should be 'recv', got {transport.log[i + 1]}"
-            )
-
-        await client.close()
+        ops = [op for op, _ in transport.log]
+        assert ops == ["send", "recv"] * 4, transport.log
 
-    async def test_send_only_ops_serialized_with_queries(self) -> None:
+    async def test_send_only_ops_serialized_with_queries(
+        self, connect_client: ConnectClient
+    ) -> None:
         """Fire-and-forget commands (move_out) must also be serialized with
         query commands so they don't steal bytes from the wire.
         """
         response_map = {STATUS_REQ: STATUS_RESP}
         transport = OrderTrackingTransport(response_map)
-        client = SeymourClient(transport, max_retries=1, request_timeout=5.0)
-        await client.connect()
+        client = await connect_client(transport)
 
-        tasks = [
-            asyncio.create_task(client.get_status()),
-            asyncio.create_task(client.move_out(protocol.MotorID.TOP, protocol.MovementCode.JOG)),
-            asyncio.create_task(client.get_status()),
-        ]
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(client.get_status())
+            tg.create_task(client.move_out(protocol.MotorID.TOP, protocol.MovementCode.JOG))
+            tg.create_task(client.get_status())
 
         # Every send must be immediately followed by its recv (if it has one)
         # or the next send (if fire-and-forget).  No two recv in a row.
-        sends = [e for e in transport.log if e[0] == "send"]
-        recvs = [e for e in transport.log if e[0] == "recv"]
+        sends = recvs = 0
+        prev = None
+        for i, (op, _) in enumerate(transport.log):
+            if op == "send":
+                sends += 1
+            else:
+                recvs += 1
+                assert prev != "recv", f"Two consecutive recv at index {i}: {transport.log}"
+            prev = op
 
         # 3 sends total: 2 status queries + 1 move_out
-        assert len(sends) == 3
+        assert sends == 3
         # 2 receives: only the status queries read back
-        assert len(recvs) == 2
-
-        # The log should never have two recvs in a row
-        for i in range(len(transport.log) - 1):
-            if transport.log[i][0] == "recv":
-                assert transport.log[i + 1][0] != "recv", (
-                    f"Two consecutive recv at index {i}: {transport.log}"
-                )
-
-        await client.close()
+        assert recvs == 2
 
 
 class TestConcurrentParsing:
@@ -217,38 +239,34 @@ class TestConcurrentParsing:
     to response frames ending up at the wrong decoder.
     """
 
-    async def test_concurrent_get_status(self) -> None:
-        """Many concurrent get_status() calls all decode without error."""
-        transport = OrderTrackingTransport({STATUS_REQ: STATUS_RESP})
-        client = SeymourClient(transport, max_retries=1, request_timeout=5.0)
-        await client.connect()
-
-        results = await asyncio.gather(*[client.get_status() for _ in range(10)])
-
-        for r in results:
-            assert isinstance(r, protocol.MaskStatus)
-            assert r.code == protocol.StatusCode.STOPPED_AT_RATIO
-            assert r.ratio == protocol.Ratio("178")
-
-        await client.close()
-
-    async def test_concurrent_get_positions(self) -> None:
-        """Many concurrent get_positions() calls all decode without error."""
-        transport = OrderTrackingTransport({POSITIONS_REQ: POSITIONS_RESP})
-        client = SeymourClient(transport, max_retries=1, request_timeout=5.0)
-        await client.connect()
-
-        results = await asyncio.gather(*[client.get_positions() for _ in range(10)])
+    @pytest.mark.parametrize(
+        ("method", "request_frame", "response", "expected"),
+        [
+            pytest.param("get_status", STATUS_REQ, STATUS_RESP, STATUS, id="status"),
+            pytest.param("get_positions", POSITIONS_REQ, POSITIONS_RESP, POSITIONS, id="positions"),
+        ],
+    )
+    async def test_concurrent_calls_all_decode(
+        self,
+        connect_client: ConnectClient,
+        method: str,
+        request_frame: bytes,
+        response: bytes,
+        expected: object,
+    ) -> None:
+        """Many concurrent calls to the same query all decode without error."""
+        transport = OrderTrackingTransport({request_frame: response})
+        client = await connect_client(transport)
+        query = getattr(client, method)
 
-        for r in results:
-            assert isinstance(r, list)
-            assert len(r) == 2
-            assert r[0].motor_id == protocol.MotorID.TOP
-            assert r[1].motor_id == protocol.MotorID.BOTTOM
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(query()) for _ in range(10)]
 
-        await client.close()
+        assert [t.result() for t in tasks] == [expected] * 10
 
-    async def test_concurrent_mixed_operations_no_parse_error(self) -> None:
+    async def test_concurrent_mixed_operations_no_parse_error(
+        self, connect_client: ConnectClient
+    ) -> None:
         """Interleaving get_status and get_positions — whose response formats
         are incompatible — must never cause a parse error.
 
@@ -257,37 +275,35 @@ class TestConcurrentParsing:
         raising ``SeymourProtocolError``.
         """
         response_map = {STATUS_REQ: STATUS_RESP, POSITIONS_REQ: POSITIONS_RESP}
-        transport = OrderTrackingTransport(response_map, op_delay=0.01)
-        client = SeymourClient(transport, max_retries=1, request_timeout=5.0)
-        await client.connect()
+        transport = OrderTrackingTransport(response_map)
+        client = await connect_client(transport)
 
         tasks: list[asyncio.Task[object]] = []
-        for i in range(20):
-            if i % 2 == 0:
-                tasks.append(asyncio.create_task(client.get_status()))
-            else:
-                tasks.append(asyncio.create_task(client.get_positions()))
+        async with asyncio.TaskGroup() as tg:
+            for i in range(20):
+                if i % 2 == 0:
+                    tasks.append(tg.create_task(client.get_status()))
+                else:
+                    tasks.append(tg.create_task(client.get_positions()))
 
-        results = await asyncio.gather(*tasks)
+        results = [t.result() for t in tasks]
 
         statuses = [r for r in results if isinstance(r, protocol.MaskStatus)]
         positions = [r for r in results if isinstance(r, list)]
         assert len(statuses) == 10
         assert len(positions) == 10
 
-        await client.close()
-
 
 class TestTornReadPrevention:
     """Use a ``PipedTransport`` backed by a real ``asyncio.StreamReader`` to
     prove that the client lock prevents torn reads.
 
-    Without the lock, two concurrent ``readuntil(b"]")`` calls on the same
+    Without the lock, two concurrent ``receive()`` calls on the same
     StreamReader race: the first one might consume the ``]`` delimiter of the
     second caller's frame, yielding garbage to both.
     """
 
-    async def test_piped_concurrent_reads_intact(self) -> None:
+    async def test_piped_concurrent_reads_intact(self, connect_client: ConnectClient) -> None:
         """Concurrent queries through a real StreamReader each get a
         well-formed, parseable response.
         """
@@ -296,41 +312,31 @@ class TestTornReadPrevention:
             STATUS_REQ: STATUS_RESP,
             POSITIONS_REQ: POSITIONS_RESP,
         }
-        client = SeymourClient(transport, max_retries=1, request_timeout=5.0)
-        await client.connect()
-
-        status_task = asyncio.create_task(client.get_status())
-        positions_task = asyncio.create_task(client.get_positions())
+        client = await connect_client(transport)
 
-        status, positions = await asyncio.gather(status_task, positions_task)
+        async with asyncio.TaskGroup() as tg:
+            status_task = tg.create_task(client.get_status())
+            positions_task = tg.create_task(client.get_positions())
 
-        assert isinstance(status, protocol.MaskStatus)
-        assert status.code == protocol.StatusCode.STOPPED_AT_RATIO
-        assert isinstance(positions, list)
-        assert len(positions) == 2
+        assert status_task.result() == STATUS
+        assert positions_task.result() == POSITIONS
 
-        await client.close()
-
-    async def test_piped_high_fanout(self) -> None:
+    async def test_piped_high_fanout(self, connect_client: ConnectClient) -> None:
         """Many concurrent operations on a real StreamReader all succeed."""
         transport = PipedTransport()
         transport._response_map = {STATUS_REQ: STATUS_RESP}
-        client = SeymourClient(transport, max_retries=1, request_timeout=5.0)
-        await client.connect()
+        client = await connect_client(transport)
 
-        results = await asyncio.gather(*[client.get_status() for _ in range(20)])
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(client.get_status()) for _ in range(20)]
 
-        for r in results:
-            assert isinstance(r, protocol.MaskStatus)
-            assert r.code == protocol.StatusCode.STOPPED_AT_RATIO
-
-        await client.close()
+        assert [t.result() for t in tasks] == [STATUS] * 20
 
 
 class TestStressHighFanout:
     """Stress test with many concurrent callers of different operation types."""
 
-    async def test_50_concurrent_mixed_ops(self) -> None:
+    async def test_50_concurrent_mixed_ops(self, connect_client: ConnectClient) -> None:
         """50 concurrent tasks mixing queries and fire-and-forget commands.
 
         Every query must decode correctly; no ``SeymourProtocolError`` or
@@ -341,9 +347,8 @@ class TestStressHighFanout:
             POSITIONS_REQ: POSITIONS_RESP,
             MOVE_OUT_REQ: b"IGNORED",  # not read; fire-and-forget
         }
-        transport = OrderTrackingTransport(response_map, op_delay=0.002)
-        client = SeymourClient(transport, max_retries=1, request_timeout=10.0)
-        await client.connect()
+        transport = OrderTrackingTransport(response_map)
+        client = await connect_client(transport, request_timeout=10.0)
 
         async def status() -> protocol.MaskStatus:
             return await client.get_status()
@@ -355,16 +360,17 @@ class TestStressHighFanout:
             await client.move_out(protocol.MotorID.TOP, protocol.MovementCode.JOG)
 
         tasks: list[asyncio.Task[object]] = []
-        for i in range(50):
-            match i % 3:
-                case 0:
-                    tasks.append(asyncio.create_task(status()))
-                case 1:
-                    tasks.append(asyncio.create_task(positions()))
-                case 2:
-                    tasks.append(asyncio.create_task(move()))
-
-        results = await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            for i in range(50):
+                match i % 3:
+                    case 0:
+                        tasks.append(tg.create_task(status()))
+                    case 1:
+                        tasks.append(tg.create_task(positions()))
+                    case 2:
+                        tasks.append(tg.create_task(move()))
+
+        results = [t.result() for t in tasks]
 
         # Count successful results by type.
         n_status = sum(1 for r in results if isinstance(r, protocol.MaskStatus))
@@ -376,9 +382,7 @@ class TestStressHighFanout:
         assert n_none == 16
         assert n_status + n_positions + n_none == 50
 
-        await client.close()
-
-    async def test_no_protocol_errors_under_contention(self) -> None:
+    async def test_no_protocol_errors_under_contention(self, connect_client: ConnectClient) -> None:
         """Specifically assert that ``SeymourProtocolError`` is never raised
         when many callers hit the client simultaneously.
 
@@ -386,9 +390,8 @@ class TestStressHighFanout:
         routinely ended up at the wrong decoder.
         """
         response_map = {STATUS_REQ: STATUS_RESP, POSITIONS_REQ: POSITIONS_RESP}
-        transport = OrderTrackingTransport(response_map, op_delay=0.003)
-        client = SeymourClient(transport, max_retries=1, request_timeout=10.0)
-        await client.connect()
+        transport = OrderTrackingTransport(response_map)
+        client = await connect_client(transport, request_timeout=10.0)
 
         errors: list[Exception] = []
 
@@ -407,15 +410,14 @@ class TestStressHighFanout:
                 return None
 
         tasks: list[asyncio.Task[object]] = []
-        for i in range(30):
-            if i % 2 == 0:
-                tasks.append(asyncio.create_task(safe_status()))
-            else:
-                tasks.append(asyncio.create_task(safe_positions()))
+        async with asyncio.TaskGroup() as tg:
+            for i in range(30):
+                if i % 2 == 0:
+                    tasks.append(tg.create_task(safe_status()))
+                else:
+                    tasks.append(tg.create_task(safe_positions()))
 
-        results = await asyncio.gather(*tasks)
+        results = [t.result() for t in tasks]
 
         assert len(errors) == 0, f"Got {len(errors)} protocol error(s): {errors}"
         assert all(r is not None for r in results)
-
-        await client.close()
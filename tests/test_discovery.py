@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
@@ -13,8 +14,10 @@ from seymourlib.discovery import (
     _parse_amxb_payload,
     enumerate_serial_transports,
     enumerate_tcp_transports,
+    load_cached_tcp_transports,
+    store_cached_tcp_transports,
 )
-from seymourlib.transport import ITACH_SERIAL_PORT, SEYMOUR_BAUD_RATE
+from seymourlib.transport import ITACH_SERIAL_PORT, SEYMOUR_BAUD_RATE, TCPTransport
 
 
 def test_parse_amxb_payload_parses_expected_fields() -> None:
@@ -31,11 +34,25 @@ def test_parse_amxb_payload_parses_expected_fields() -> None:
     assert parsed["Config-URL"] == "http://192.168.1.7"
 
 
+def test_parse_amxb_payload_flags_and_rejects() -> None:
+    assert _parse_amxb_payload("AMXB<-SDKClass=Utility><-Beta>") == {
+        "SDKClass": "Utility",
+        "Beta": "",
+    }
+
+    with pytest.raises(ValueError):
+        _parse_amxb_payload("AMXB garbage")
+
+    with pytest.raises(ValueError):
+        _parse_amxb_payload("NOTIFY * HTTP/1.1")
+
+
 @pytest.mark.asyncio
 async def test_enumerate_tcp_transports_returns_unique_hosts(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     responses = [
+        (b"garbled", ("192.168.1.8", discovery.MCAST_PORT)),
         (
             b"AMXB<-UUID=One><-Model=iTachIP2SL><-Status=Ready>\r\n",
             ("192.168.1.7", discovery.MCAST_PORT),
@@ -44,6 +61,10 @@ async def test_enumerate_tcp_transports_returns_unique_hosts(
             b"AMXB<-UUID=Two><-Model=iTachIP2SL><-Status=Ready>\r\n",
             ("192.168.1.8", discovery.MCAST_PORT),
         ),
+        (
+            b"AMXB<-UUID=Again><-Model=iTachIP2SL><-Status=Ready>\r\n",
+            ("192.168.1.7", discovery.MCAST_PORT),
+        ),
     ]
 
     class DummyTransport:
@@ -74,6 +95,8 @@ async def test_enumerate_tcp_transports_returns_unique_hosts(
     assert len(candidates) == 2
     assert {candidate.host for candidate in candidates} == {"192.168.1.7", "192.168.1.8"}
     assert all(candidate.port == ITACH_SERIAL_PORT for candidate in candidates)
+    # Repeat beacons keep the first parsed metadata; an unparseable one is replaced.
+    assert [candidate.metadata["UUID"] for candidate in candidates] == ["One", "Two"]
     assert transport.closed
 
 
@@ -113,3 +136,70 @@ async def test_enumerate_serial_transports_missing_dependency(
 
     with pytest.raises(DiscoveryError, match="missing pyserial"):
         await enumerate_serial_transports(SEYMOUR_BAUD_RATE)
+
+
+@pytest.mark.asyncio
+async def test_tcp_transport_cache_round_trip(tmp_path: Path) -> None:
+    cache_path = tmp_path / "discovery.json"
+    candidate = discovery.TCPTransportCandidate(
+        transport=TCPTransport("192.168.1.7", ITACH_SERIAL_PORT),
+        host="192.168.1.7",
+        port=ITACH_SERIAL_PORT,
+        metadata={"UUID": "One", "Model": "iTachIP2SL"},
+        raw_beacon="AMXB<-UUID=One><-Model=iTachIP2SL>",
+    )
+
+    await store_cached_tcp_transports([candidate], path=cache_path)
+    cached = await load_cached_tcp_transports(path=cache_path)
+
+    assert len(cached) == 1
+    assert cached[0].host == "192.168.1.7"
+    assert cached[0].port == ITACH_SERIAL_PORT
+    assert cached[0].metadata == candidate.metadata
+    assert cached[0].transport.host == "192.168.1.7"
+
+    # Entries are scoped to the interface they were discovered on, and expire after the TTL.
+    assert await load_cached_tcp_transports(interface_ip="10.0.0.1", path=cache_path) == []
+    assert await load_cached_tcp_transports(ttl=0, path=cache_path) == []
+
+
+@pytest.mark.asyncio
+async def test_tcp_transport_cache_concurrent_writers(tmp_path: Path) -> None:
+    cache_path = tmp_path / "discovery.json"
+    candidates = [
+        discovery.TCPTransportCandidate(
+            transport=TCPTransport(f"192.168.1.{n}", ITACH_SERIAL_PORT),
+            host=f"192.168.1.{n}",
+            port=ITACH_SERIAL_PORT,
+            metadata={"UUID": str(n)},
+            raw_beacon=f"AMXB<-UUID={n}>",
+        )
+        for n in range(8)
+    ]
+
+    await asyncio.gather(
+        *(store_cached_tcp_transports([candidate], path=cache_path) for candidate in candidates)
+    )
+
+    # Whichever writer lands last wins, but the published file is always complete and no
+    # temporary files are left behind.
+    cached = await load_cached_tcp_transports(path=cache_path)
+    assert len(cached) == 1
+    assert cached[0].host in {candidate.host for candidate in candidates}
+    assert [p.name for p in tmp_path.iterdir()] == ["discovery.json"]
+
+
+@pytest.mark.asyncio
+async def test_tcp_transport_cache_missing_or_corrupt(tmp_path: Path) -> None:
+    cache_path = tmp_path / "discovery.json"
+    assert await load_cached_tcp_transports(path=cache_path) == []
+
+    cache_path.write_text("not json")
+    assert await load_cached_tcp_transports(path=cache_path) == []
+
+    # Well-formed JSON with the wrong shape below the top level is ignored, not fatal.
+    cache_path.write_text('{"": ["x"]}')
+    assert await load_cached_tcp_transports(path=cache_path) == []
+
+    cache_path.write_text('{"": {"192.168.1.7": ["x"], "192.168.1.8": "x"}}')
+    assert await load_cached_tcp_transports(path=cache_path) == []
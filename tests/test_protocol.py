@@ -53,6 +53,12 @@ class TestSingleByte:
         assert not pattern.match(b"Z")
         assert not pattern.match(b"")
 
+    def test_regex_is_memoized_per_class(self) -> None:
+        """Test that regex() results are cached per class and group suffix."""
+        assert protocol.MotorID.regex(1) is protocol.MotorID.regex(1)
+        assert protocol.MotorID.regex(1) != protocol.MotorID.regex(2)
+        assert protocol.MotorID.regex() != protocol.StatusCode.regex()
+
 
 class TestRatio:
     """Test the Ratio class validation and functionality."""
@@ -90,6 +96,16 @@ class TestRatio:
         with pytest.raises(ValueError, match="ratio_id must be numeric"):
             protocol.Ratio("1.2")
 
+        with pytest.raises(ValueError, match="ratio_id must be numeric"):
+            protocol.Ratio("\u0661\u0662\u0663")  # Arabic-Indic digits
+
+    def test_from_digits_matches_validated_ratio(self) -> None:
+        """Test that the decoders' unvalidated constructor builds an equivalent Ratio."""
+        ratio = protocol.Ratio._from_digits(b"235")
+        assert ratio == protocol.Ratio("235")
+        assert hash(ratio) == hash(protocol.Ratio("235"))
+        assert ratio.id == "235"
+
     def test_ratio_regex(self) -> None:
         """Test the Ratio regex pattern."""
         regex = protocol.Ratio.regex()
@@ -194,6 +210,14 @@ class TestRatioSetting:
             # Invalid ratio format
             protocol.RatioSetting.from_response_entry(b"abcTestLbl16.0  12.0  50.0-5.0", 1)
 
+        with pytest.raises(SeymourProtocolError, match="Malformed ratio setting entry"):
+            # Right length, but a width that float() alone would accept
+            protocol.RatioSetting.from_response_entry(b"123TestLbl1 1e3  4321.050.0-5.0", 1)
+
+        with pytest.raises(SeymourProtocolError, match="Malformed ratio setting entry"):
+            # Right length, but a non-numeric adjustment
+            protocol.RatioSetting.from_response_entry(b"123TestLbl11234.04321.050.0-abc", 1)
+
 
 class TestEncoding:
     """Test all encoding functions."""
@@ -272,6 +296,37 @@ class TestEncoding:
         result = protocol.encode_update_ratio(ratio)
         assert result == b"[01U456]"
 
+    def test_encode_clear_settings(self) -> None:
+        """Test encoding clear settings commands with and without a ratio."""
+        assert protocol.encode_clear_settings(protocol.Ratio("789")) == b"[01X789]"
+        assert protocol.encode_clear_settings(None) == b"[01X]"
+
+    def test_encode_diagnostics(self) -> None:
+        """Test encoding diagnostics commands."""
+        result = protocol.encode_diagnostics(protocol.DiagnosticOption.LIST_SETTINGS_JSON)
+        assert result == b"[01@D10]"
+
+    def test_precomputed_frames_match_generic_framing(self) -> None:
+        """Test that the precomputed encoders agree with building each frame from scratch."""
+        for motor in protocol.MotorID:
+            for movement in protocol.MovementCode:
+                assert protocol.encode_move_out(motor, movement) == protocol._frame(
+                    f"O{motor}{movement}"
+                )
+                assert protocol.encode_move_in(motor, movement) == protocol._frame(
+                    f"I{motor}{movement}"
+                )
+            assert protocol.encode_home(motor) == protocol._frame(f"A{motor}")
+            assert protocol.encode_halt(motor) == protocol._frame(f"H{motor}")
+            assert protocol.encode_calibrate(motor) == protocol._frame(f"C{motor}")
+        for option in protocol.DiagnosticOption:
+            assert protocol.encode_diagnostics(option) == protocol._frame(f"@D{option}")
+        ratio = protocol.Ratio("042")
+        assert protocol.encode_move_ratio(ratio) == protocol._frame("M042")
+        assert protocol.encode_update_ratio(ratio) == protocol._frame("U042")
+        assert protocol.encode_clear_settings(ratio) == protocol._frame("X042")
+        assert protocol.encode_read_settings() == b"[01R]"
+
 
 class TestDecoding:
     """Test all decoding functions."""
@@ -409,6 +464,18 @@ class TestErrorCases:
         with pytest.raises(SeymourProtocolError, match="Malformed status response"):
             protocol.decode_status(b"[01P12]")  # Invalid ratio format
 
+        with pytest.raises(SeymourProtocolError, match="Malformed status response"):
+            protocol.decode_status(b"[01P12a]")  # Non-numeric ratio
+
+        with pytest.raises(SeymourProtocolError, match="Malformed status response"):
+            protocol.decode_status(b"[01P1234]")  # Ratio too long
+
+        with pytest.raises(SeymourProtocolError, match="Malformed status response"):
+            protocol.decode_status(b"[01P123")  # Missing frame end
+
+        with pytest.raises(SeymourProtocolError, match="Malformed status response"):
+            protocol.decode_status(b"[01]")  # Empty payload
+
     def test_decode_positions_malformed(self) -> None:
         """Test that malformed positions responses raise SeymourProtocolError."""
         with pytest.raises(SeymourProtocolError, match="Malformed positions response"):
@@ -420,6 +487,12 @@ class TestErrorCases:
         with pytest.raises(SeymourProtocolError, match="Malformed motor position entries"):
             protocol.decode_positions(b"[012T50.0]")  # Missing second motor
 
+        with pytest.raises(SeymourProtocolError, match="Malformed motor position entries"):
+            protocol.decode_positions(b"[011T5x.0]")  # Non-numeric position
+
+        with pytest.raises(SeymourProtocolError, match="Malformed motor position entries"):
+            protocol.decode_positions(b"[011T5e-1]")  # Exponent that float() alone would accept
+
     def test_decode_system_info_malformed(self) -> None:
         """Test that malformed system info responses raise SeymourProtocolError."""
         with pytest.raises(SeymourProtocolError, match="Malformed system info response"):
@@ -428,6 +501,10 @@ class TestErrorCases:
         with pytest.raises(SeymourProtocolError, match="Malformed system info response"):
             protocol.decode_system_info(b"[01TooShort]")  # Too short
 
+        with pytest.raises(SeymourProtocolError, match="Malformed system info response"):
+            # Serial number missing its second hyphen
+            protocol.decode_system_info(b"[01PRH-123             0123.00069.1SS-03250Berg TB]")
+
     def test_decode_settings_malformed(self) -> None:
         """Test that malformed settings responses raise SeymourProtocolError."""
         with pytest.raises(SeymourProtocolError, match="Malformed settings response"):